@@ -17,7 +17,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from busca.indexador import Indexador
 from busca.consulta import ProcessadorConsulta
-from utils.config import Config
+from utils.config import get_config
 from utils.logger import setup_logger
 
 # Configuração do logger
@@ -58,7 +58,7 @@ def main():
     args = parse_arguments()
     
     # Carrega configurações
-    config = Config(args.config)
+    config = get_config(args.config)
     
     # Define nome do índice
     index_name = args.index or config.get('elasticsearch_index', 'dou')
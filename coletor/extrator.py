@@ -20,7 +20,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from tqdm import tqdm
 
-from coletor.cache import Cache
+from utils.cache import Cache
 from utils.logger import setup_logger
 
 # Configuração do logger
@@ -15,7 +15,7 @@ from datetime import datetime
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from coletor.extrator import DOUExtrator
-from utils.config import Config
+from utils.config import get_config
 from utils.logger import setup_logger
 
 # Configuração do logger
@@ -48,7 +48,7 @@ def main():
     args = parse_arguments()
     
     # Carrega configurações
-    config = Config(args.config)
+    config = get_config(args.config)
     
     # Valida e processa argumentos
     if args.data:
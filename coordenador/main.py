@@ -19,7 +19,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from coordenador.orquestrador import Orquestrador
 from coordenador.monitor import Monitor
-from utils.config import Config
+from utils.config import get_config
 from utils.logger import setup_logger
 
 # Configuração do logger
@@ -51,7 +51,7 @@ def main():
     args = parse_arguments()
     
     # Carrega configurações
-    config = Config(args.config)
+    config = get_config(args.config)
     
     # Define diretório de saída
     output_dir = args.output_dir or config.get('dados_dir', '../dados')
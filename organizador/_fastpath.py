@@ -0,0 +1,76 @@
+"""
+Caminho rápido de validação estrutural para o Agente Organizador.
+
+Este módulo implementa a verificação das linhas geradas pelo organizador
+sobre arrays de campos escalares (estrutura de arrays), compilada com
+numba quando disponível. Sem numba, a mesma função roda em Python puro
+diretamente sobre as listas acumuladas, sem conversão para numpy.
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def _validar_arrays_linhas(tem_titulo_arr, tem_resumo_arr):
+    """
+    Procura a primeira linha estruturalmente inválida.
+    
+    Args:
+        tem_titulo_arr: 1 se a publicação possui título, 0 caso contrário
+        tem_resumo_arr: 1 se a publicação possui resumo, 0 caso contrário
+        
+    Returns:
+        int: Índice da primeira linha inválida, ou -1 se todas são válidas
+    """
+    for i in range(len(tem_titulo_arr)):
+        if tem_titulo_arr[i] == 0 or tem_resumo_arr[i] == 0:
+            return i
+    return -1
+
+_USAR_NUMBA = njit is not None and np is not None
+
+if _USAR_NUMBA:
+    _validar_arrays_linhas = njit(cache=True)(_validar_arrays_linhas)
+
+class ColetorLinhas:
+    """
+    Acumula os campos escalares das linhas em uma única passagem.
+    
+    Os valores são guardados em listas durante a travessia dos dados e
+    convertidos em arrays apenas quando a validação compilada está disponível.
+    """
+    
+    def __init__(self):
+        """Inicializa os acumuladores de campos."""
+        self.tem_titulo = []
+        self.tem_resumo = []
+    
+    def adicionar(self, publicacao):
+        """
+        Registra os campos estruturais de uma publicação.
+        
+        Args:
+            publicacao (dict): Publicação processada
+        """
+        self.tem_titulo.append(1 if 'titulo' in publicacao else 0)
+        self.tem_resumo.append(1 if 'resumo' in publicacao else 0)
+    
+    def primeira_invalida(self):
+        """
+        Valida as linhas acumuladas.
+        
+        Returns:
+            int: Índice da primeira linha inválida, ou -1 se todas são válidas
+        """
+        if not _USAR_NUMBA:
+            return _validar_arrays_linhas(self.tem_titulo, self.tem_resumo)
+        
+        tem_titulo_arr = np.array(self.tem_titulo, dtype=np.uint8)
+        tem_resumo_arr = np.array(self.tem_resumo, dtype=np.uint8)
+        return int(_validar_arrays_linhas(tem_titulo_arr, tem_resumo_arr))
@@ -107,13 +107,15 @@ class CSVBuilder:
             logger.error(f"Erro ao gerar arquivo Excel: {str(e)}")
             return False
     
-    def gerar_json(self, registros, arquivo_saida):
+    def gerar_json(self, registros, arquivo_saida, ndjson=False):
         """
         Gera um arquivo JSON com os registros fornecidos.
         
         Args:
             registros (list): Lista de dicionários com os dados
             arquivo_saida (str): Caminho para o arquivo de saída
+            ndjson (bool): Se True, grava um objeto JSON por linha (NDJSON,
+                sempre em UTF-8) em vez de um único objeto com a lista
             
         Returns:
             bool: True se a geração foi bem-sucedida, False caso contrário
@@ -122,6 +124,9 @@ class CSVBuilder:
             # Garante que o diretório de saída existe
             os.makedirs(os.path.dirname(arquivo_saida), exist_ok=True)
             
+            if ndjson:
+                return self._gerar_ndjson(registros, arquivo_saida)
+            
             # Estrutura o JSON
             dados_json = {
                 'registros': registros,
@@ -139,6 +144,34 @@ class CSVBuilder:
             logger.error(f"Erro ao gerar arquivo JSON: {str(e)}")
             return False
     
+    def _gerar_ndjson(self, registros, arquivo_saida):
+        """
+        Grava os registros em formato NDJSON, um objeto por linha.
+        
+        Args:
+            registros (list): Lista de dicionários com os dados
+            arquivo_saida (str): Caminho para o arquivo de saída
+            
+        Returns:
+            bool: True se a geração foi bem-sucedida
+        """
+        try:
+            # orjson serializa direto para bytes; usa json como alternativa
+            import orjson
+            serializar = orjson.dumps
+        except ImportError:
+            def serializar(registro):
+                return json.dumps(registro, ensure_ascii=False).encode('utf-8')
+        
+        # Buffer de 1 MiB para agrupar as escritas em poucas chamadas de sistema
+        with open(arquivo_saida, 'wb', buffering=1 << 20) as f:
+            for registro in registros:
+                f.write(serializar(registro))
+                f.write(b'\n')
+        
+        logger.info(f"Arquivo NDJSON gerado com sucesso: {arquivo_saida}")
+        return True
+    
     def converter_csv_para_excel(self, arquivo_csv, arquivo_excel=None):
         """
         Converte um arquivo CSV existente para Excel.
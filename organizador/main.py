@@ -8,6 +8,7 @@ Seção, Número da Página, Título e Resumo do Conteúdo.
 
 import argparse
 import json
+import operator
 import os
 import sys
 from datetime import datetime
@@ -15,14 +16,19 @@ from datetime import datetime
 # Adiciona o diretório raiz ao path para importar módulos do projeto
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from organizador._fastpath import ColetorLinhas
 from organizador.csv_builder import CSVBuilder
 from organizador.validador import ValidadorDados
-from utils.config import Config
+from utils.config import get_config
 from utils.logger import setup_logger
 
 # Configuração do logger
 logger = setup_logger('organizador')
 
+# Extratores dos textos de entidades e palavras-chave usados nas junções
+_get_texto = operator.methodcaller('get', 'texto', '')
+_get_palavra = operator.methodcaller('get', 'palavra', '')
+
 def parse_arguments():
     """Parse os argumentos da linha de comando."""
     parser = argparse.ArgumentParser(description='Agente Organizador para o DOU')
@@ -36,6 +42,8 @@ def parse_arguments():
                         help='Separador para o arquivo CSV')
     parser.add_argument('--encoding', type=str, default='utf-8',
                         help='Encoding para o arquivo CSV')
+    parser.add_argument('--ndjson', action='store_true',
+                        help='Gera o JSON de saída com um registro por linha (NDJSON)')
     parser.add_argument('--config', type=str,
                         help='Caminho para arquivo de configuração')
     
@@ -46,7 +54,7 @@ def main():
     args = parse_arguments()
     
     # Carrega configurações
-    config = Config(args.config)
+    config = get_config(args.config)
     
     # Verifica se o arquivo de entrada existe
     if not os.path.exists(args.input):
@@ -73,10 +81,10 @@ def main():
         logger.error(f"Erro ao carregar arquivo de entrada: {str(e)}")
         return 1
     
-    # Valida os dados
+    # Valida os dados (as publicações são verificadas na montagem dos registros)
     logger.info("Validando dados processados")
     validador = ValidadorDados()
-    if not validador.validar(dados_processados):
+    if not validador.validar(dados_processados, verificar_publicacoes=False):
         logger.error("Validação de dados falhou")
         logger.error(f"Erros encontrados: {validador.erros}")
         return 1
@@ -92,21 +100,25 @@ def main():
     try:
         # Extrai dados das páginas regulares
         registros = []
+        linhas = ColetorLinhas()
+        
+        # Campos garantidos pelo validador
+        data_publicacao = dados_processados['data']
+        secao = dados_processados['secao']
         
-        for pagina in dados_processados.get('paginas', []):
-            data_publicacao = dados_processados.get('data', '')
-            secao = dados_processados.get('secao', '')
-            numero_pagina = pagina.get('numero_pagina', '')
+        for pagina in dados_processados['paginas']:
+            numero_pagina = pagina['numero_pagina']
             
-            for publicacao in pagina.get('publicacoes', []):
+            for publicacao in pagina['publicacoes']:
+                linhas.adicionar(publicacao)
                 registro = {
                     'data_publicacao': data_publicacao,
                     'secao': secao,
                     'numero_pagina': numero_pagina,
                     'titulo': publicacao.get('titulo', ''),
                     'resumo': publicacao.get('resumo', ''),
-                    'entidades': ', '.join([e.get('texto', '') for e in publicacao.get('entidades', [])]),
-                    'palavras_chave': ', '.join([p.get('palavra', '') for p in publicacao.get('palavras_chave', [])]),
+                    'entidades': ', '.join(filter(None, map(_get_texto, publicacao.get('entidades') or ()))),
+                    'palavras_chave': ', '.join(filter(None, map(_get_palavra, publicacao.get('palavras_chave') or ()))),
                     'tipo_documento': publicacao.get('tipo_documento', ''),
                     'id': publicacao.get('id', '')
                 }
@@ -122,24 +134,39 @@ def main():
                 
                 registros.append(registro)
         
+        # Verifica a estrutura das publicações das páginas regulares
+        indice_invalido = linhas.primeira_invalida()
+        if indice_invalido >= 0:
+            registro_invalido = registros[indice_invalido]
+            logger.error("Validação de dados falhou")
+            logger.error(
+                f"Publicação inválida no registro {indice_invalido + 1} "
+                f"(página {registro_invalido['numero_pagina']}): "
+                f"campos 'titulo'/'resumo' ausentes"
+            )
+            return 1
+        
         # Extrai dados das seções extras, se existirem
         if 'secoes_extras' in dados_processados and dados_processados['secoes_extras']:
+            secao_marcada = f"{secao}E"  # Marca como seção extra
+            
             for secao_extra in dados_processados['secoes_extras']:
-                conteudo = secao_extra.get('conteudo', {})
+                conteudo = secao_extra['conteudo']
                 numero_pagina = conteudo.get('numero_pagina', '')
+                url_secao_extra = secao_extra['url']
                 
-                for publicacao in conteudo.get('publicacoes', []):
+                for publicacao in conteudo['publicacoes']:
                     registro = {
-                        'data_publicacao': dados_processados.get('data', ''),
-                        'secao': f"{dados_processados.get('secao', '')}E",  # Marca como seção extra
+                        'data_publicacao': data_publicacao,
+                        'secao': secao_marcada,
                         'numero_pagina': numero_pagina,
                         'titulo': publicacao.get('titulo', ''),
                         'resumo': publicacao.get('resumo', ''),
-                        'entidades': ', '.join([e.get('texto', '') for e in publicacao.get('entidades', [])]),
-                        'palavras_chave': ', '.join([p.get('palavra', '') for p in publicacao.get('palavras_chave', [])]),
+                        'entidades': ', '.join(filter(None, map(_get_texto, publicacao.get('entidades') or ()))),
+                        'palavras_chave': ', '.join(filter(None, map(_get_palavra, publicacao.get('palavras_chave') or ()))),
                         'tipo_documento': publicacao.get('tipo_documento', ''),
                         'id': publicacao.get('id', ''),
-                        'url_secao_extra': secao_extra.get('url', '')
+                        'url_secao_extra': url_secao_extra
                     }
                     
                     # Adiciona metadados extraídos
@@ -161,7 +188,7 @@ def main():
         elif formato == 'excel':
             csv_builder.gerar_excel(registros, output_file)
         elif formato == 'json':
-            csv_builder.gerar_json(registros, output_file)
+            csv_builder.gerar_json(registros, output_file, ndjson=args.ndjson)
         else:
             logger.warning(f"Formato '{formato}' não suportado. Gerando CSV como fallback.")
             csv_builder.gerar_csv(registros, output_file.replace(f".{formato}", ".csv"))
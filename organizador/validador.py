@@ -6,11 +6,19 @@ validar os dados processados antes da geração de arquivos CSV.
 """
 
 import json
+from collections import Counter
+
 from utils.logger import setup_logger
 
 # Configuração do logger
 logger = setup_logger('organizador.validador')
 
+# Seções válidas do DOU, normalizadas como string minúscula
+_SECOES_VALIDAS = frozenset({'1', '2', '3', 'e'})
+
+# Campos obrigatórios de cada publicação
+_CAMPOS_PUBLICACAO = ('titulo', 'resumo')
+
 class ValidadorDados:
     """
     Classe para validação dos dados processados.
@@ -23,12 +31,16 @@ class ValidadorDados:
         """Inicializa o validador de dados."""
         self.erros = []
     
-    def validar(self, dados):
+    def validar(self, dados, verificar_publicacoes=True, fail_fast=True):
         """
         Valida os dados processados.
         
         Args:
             dados (dict): Dados processados a serem validados
+            verificar_publicacoes (bool): Se False, não percorre as publicações
+                de cada página (útil quando o chamador já as verifica)
+            fail_fast (bool): Se True, interrompe a validação no primeiro erro;
+                se False, percorre todos os dados e acumula todos os erros
             
         Returns:
             bool: True se os dados são válidos, False caso contrário
@@ -39,16 +51,8 @@ class ValidadorDados:
         if not self._validar_campos_obrigatorios(dados):
             return False
         
-        # Verifica estrutura das páginas
-        if not self._validar_estrutura_paginas(dados):
-            return False
-        
-        # Verifica consistência dos dados
-        if not self._validar_consistencia(dados):
-            return False
-        
-        # Se chegou até aqui, os dados são válidos
-        return len(self.erros) == 0
+        # Verifica estrutura e consistência em uma única passagem
+        return self._validar_fused(dados, verificar_publicacoes, fail_fast)
     
     def _validar_campos_obrigatorios(self, dados):
         """
@@ -74,75 +78,86 @@ class ValidadorDados:
         
         return True
     
-    def _validar_estrutura_paginas(self, dados):
+    def _validar_fused(self, dados, verificar_publicacoes=True, fail_fast=True):
         """
-        Verifica se a estrutura das páginas está correta.
+        Verifica a estrutura e a consistência dos dados.
+        
+        Cada página é visitada uma única vez: a mesma iteração verifica os
+        campos obrigatórios e conta os números de página para detectar
+        duplicatas.
         
         Args:
             dados (dict): Dados processados
+            verificar_publicacoes (bool): Se True, verifica também as publicações
+            fail_fast (bool): Se True, retorna no primeiro erro encontrado
             
         Returns:
-            bool: True se a estrutura das páginas está correta
+            bool: True se a estrutura e os dados são consistentes
         """
+        contagem_paginas = Counter()
+        
         for i, pagina in enumerate(dados['paginas']):
             # Verifica campos obrigatórios da página
             if 'numero_pagina' not in pagina:
                 self.erros.append(f"Campo 'numero_pagina' não encontrado na página {i+1}")
+                if fail_fast:
+                    return False
+            else:
+                numero = pagina['numero_pagina']
+                contagem_paginas[numero] += 1
+                if contagem_paginas[numero] > 1:
+                    self.erros.append(f"Número de página duplicado: {numero}")
+                    if fail_fast:
+                        return False
             
             if 'publicacoes' not in pagina:
                 self.erros.append(f"Campo 'publicacoes' não encontrado na página {i+1}")
+                if fail_fast:
+                    return False
+                continue
+            
+            if not verificar_publicacoes:
                 continue
             
             # Verifica estrutura das publicações
             for j, publicacao in enumerate(pagina['publicacoes']):
-                # Verifica campos obrigatórios da publicação
-                campos_publicacao = ['titulo', 'resumo']
-                for campo in campos_publicacao:
+                for campo in _CAMPOS_PUBLICACAO:
                     if campo not in publicacao:
                         self.erros.append(f"Campo '{campo}' não encontrado na publicação {j+1} da página {i+1}")
+                        if fail_fast:
+                            return False
         
         # Verifica seções extras, se existirem
         if 'secoes_extras' in dados and dados['secoes_extras']:
             for i, secao in enumerate(dados['secoes_extras']):
                 if 'url' not in secao:
                     self.erros.append(f"Campo 'url' não encontrado na seção extra {i+1}")
+                    if fail_fast:
+                        return False
                 
                 if 'conteudo' not in secao:
                     self.erros.append(f"Campo 'conteudo' não encontrado na seção extra {i+1}")
+                    if fail_fast:
+                        return False
                     continue
                 
                 conteudo = secao['conteudo']
                 if 'publicacoes' not in conteudo:
                     self.erros.append(f"Campo 'publicacoes' não encontrado no conteúdo da seção extra {i+1}")
+                    if fail_fast:
+                        return False
         
-        return len(self.erros) == 0
-    
-    def _validar_consistencia(self, dados):
-        """
-        Verifica a consistência dos dados.
-        
-        Args:
-            dados (dict): Dados processados
-            
-        Returns:
-            bool: True se os dados são consistentes
-        """
         # Verifica se a data está em formato válido
         if not self._validar_formato_data(dados['data']):
             self.erros.append(f"Formato de data inválido: {dados['data']}")
+            if fail_fast:
+                return False
         
         # Verifica se a seção é válida
         if not self._validar_secao(dados['secao']):
             self.erros.append(f"Seção inválida: {dados['secao']}")
-        
-        # Verifica se os números de página são consistentes
-        numeros_pagina = set()
-        for pagina in dados['paginas']:
-            if 'numero_pagina' in pagina:
-                numero = pagina['numero_pagina']
-                if numero in numeros_pagina:
-                    self.erros.append(f"Número de página duplicado: {numero}")
-                numeros_pagina.add(numero)
+            if fail_fast:
+                return False
         
         return len(self.erros) == 0
     
@@ -169,7 +184,7 @@ class ValidadorDados:
         Returns:
             bool: True se a seção é válida
         """
-        return secao in [1, 2, 3, 'e', '1', '2', '3']
+        return str(secao).lower() in _SECOES_VALIDAS
     
     def gerar_relatorio(self):
         """
@@ -184,6 +199,19 @@ class ValidadorDados:
             'erros': self.erros
         }
     
+    def gerar_relatorio_completo(self, dados):
+        """
+        Valida os dados acumulando todos os erros e gera o relatório.
+        
+        Args:
+            dados (dict): Dados processados a serem validados
+            
+        Returns:
+            dict: Relatório de validação com todos os erros encontrados
+        """
+        self.validar(dados, fail_fast=False)
+        return self.gerar_relatorio()
+    
     def salvar_relatorio(self, arquivo):
         """
         Salva o relatório de validação em um arquivo JSON.
@@ -0,0 +1,98 @@
+"""
+Módulo de cache de análises para o Agente Processador.
+
+Este módulo implementa a classe CacheAnalises, que guarda o resultado do
+processamento de cada texto de publicação, indexado pelo hash do texto,
+para que textos repetidos sejam processados uma única vez.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+from utils.cache import Cache
+from utils.logger import setup_logger
+
+# Configuração do logger
+logger = setup_logger('processador.cache')
+
+class CacheAnalises:
+    """
+    Cache das análises de textos de publicações.
+    
+    Mantém em memória as análises mais recentes (política LRU) e, se um
+    diretório for informado, persiste cada análise em disco para que novas
+    execuções reaproveitem publicações já processadas.
+    """
+    
+    def __init__(self, cache_dir=None, contexto='', max_memoria=4096):
+        """
+        Inicializa o cache de análises.
+        
+        Args:
+            cache_dir (str): Diretório para o cache em disco; se None, usa apenas memória
+            contexto (str): Identificação dos parâmetros do processamento (versão
+                da análise, modelo, configurações), incluída na chave para
+                invalidar análises geradas com outros parâmetros
+            max_memoria (int): Número máximo de análises mantidas em memória
+        """
+        self.contexto = contexto
+        self.max_memoria = max_memoria
+        self._memoria = OrderedDict()
+        self._disco = Cache(cache_dir) if cache_dir else None
+        
+        if self._disco is not None:
+            logger.debug(f"Cache de análises em disco: {cache_dir}")
+    
+    def chave(self, texto):
+        """
+        Gera a chave de cache de um texto.
+        
+        Args:
+            texto (str): Texto da publicação
+            
+        Returns:
+            str: Chave de cache (hash SHA-1 do contexto e do texto)
+        """
+        return hashlib.sha1(f"{self.contexto}\0{texto}".encode('utf-8')).hexdigest()
+    
+    def get(self, chave):
+        """
+        Recupera uma análise do cache.
+        
+        Args:
+            chave (str): Chave gerada por `chave()`
+            
+        Returns:
+            dict: Análise armazenada, ou None se não encontrada
+        """
+        analise = self._memoria.get(chave)
+        if analise is not None:
+            self._memoria.move_to_end(chave)
+            return analise
+        
+        if self._disco is not None:
+            analise = self._disco.get(chave)
+            if analise is not None:
+                self._guardar_em_memoria(chave, analise)
+        
+        return analise
+    
+    def set(self, chave, analise):
+        """
+        Armazena uma análise no cache.
+        
+        Args:
+            chave (str): Chave gerada por `chave()`
+            analise (dict): Resultado do processamento do texto
+        """
+        self._guardar_em_memoria(chave, analise)
+        
+        if self._disco is not None:
+            self._disco.set(chave, analise)
+    
+    def _guardar_em_memoria(self, chave, analise):
+        """Guarda a análise em memória, descartando a menos recente se necessário."""
+        self._memoria[chave] = analise
+        self._memoria.move_to_end(chave)
+        if len(self._memoria) > self.max_memoria:
+            self._memoria.popitem(last=False)
@@ -0,0 +1,121 @@
+"""
+Módulo de escrita dos dados processados para o Agente Processador.
+
+Este módulo implementa a classe EscritorDadosProcessados, responsável por
+gravar incrementalmente o arquivo JSON de saída, à medida que cada página
+é processada, sem manter todo o resultado em memória.
+"""
+
+import json
+import os
+from utils.logger import setup_logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Configuração do logger
+logger = setup_logger('processador.escritor')
+
+class EscritorDadosProcessados:
+    """
+    Classe para escrita incremental do JSON de dados processados.
+    
+    O arquivo gerado é um único objeto JSON, com os campos do cabeçalho
+    seguidos de listas (páginas, seções extras) cujos itens são gravados um
+    a um. A escrita é feita em um arquivo temporário, que só substitui o
+    arquivo de saída quando o processamento termina sem erros.
+    """
+    
+    def __init__(self, arquivo, cabecalho):
+        """
+        Inicializa o escritor de dados processados.
+        
+        Args:
+            arquivo (str): Caminho para o arquivo de saída
+            cabecalho (dict): Campos escalares gravados no início do objeto
+        """
+        self.arquivo = arquivo
+        self.arquivo_temporario = f"{arquivo}.tmp"
+        self.cabecalho = cabecalho
+        self._f = None
+        self._possui_campos = False
+        self._lista_aberta = False
+        self._primeiro_item = True
+    
+    def __enter__(self):
+        """Abre o arquivo temporário e grava o cabeçalho."""
+        self._f = open(self.arquivo_temporario, 'wb')
+        self._f.write(b'{')
+        self._f.write(b', '.join(
+            self._serializar(chave) + b': ' + self._serializar(valor)
+            for chave, valor in self.cabecalho.items()
+        ))
+        self._possui_campos = bool(self.cabecalho)
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Finaliza o objeto JSON e publica o arquivo, ou descarta em caso de erro."""
+        try:
+            if exc_type is None:
+                self._fechar_lista()
+                self._f.write(b'}\n')
+        finally:
+            self._f.close()
+        
+        if exc_type is None:
+            os.replace(self.arquivo_temporario, self.arquivo)
+        else:
+            logger.warning(f"Escrita interrompida; descartando {self.arquivo_temporario}")
+            os.remove(self.arquivo_temporario)
+        
+        return False
+    
+    def iniciar_lista(self, nome):
+        """
+        Inicia uma nova lista no objeto de saída, fechando a anterior.
+        
+        Args:
+            nome (str): Nome do campo da lista
+        """
+        self._fechar_lista()
+        if self._possui_campos:
+            self._f.write(b', ')
+        self._f.write(self._serializar(nome) + b': [')
+        self._possui_campos = True
+        self._lista_aberta = True
+        self._primeiro_item = True
+    
+    def escrever_item(self, item):
+        """
+        Grava um item na lista atual.
+        
+        Args:
+            item (dict): Item a ser gravado
+        """
+        if not self._primeiro_item:
+            self._f.write(b',')
+        self._f.write(b'\n')
+        self._f.write(self._serializar(item))
+        self._primeiro_item = False
+    
+    def _fechar_lista(self):
+        """Fecha a lista atual, se houver uma aberta."""
+        if self._lista_aberta:
+            self._f.write(b'\n]' if not self._primeiro_item else b']')
+            self._lista_aberta = False
+    
+    def _serializar(self, valor):
+        """
+        Serializa um valor em JSON (UTF-8), com orjson quando disponível.
+        
+        Args:
+            valor: Valor a ser serializado
+            
+        Returns:
+            bytes: Representação JSON do valor
+        """
+        if orjson is not None:
+            return orjson.dumps(valor, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(valor, ensure_ascii=False).encode('utf-8')
@@ -0,0 +1,127 @@
+"""
+Módulo de leitura dos dados brutos para o Agente Processador.
+
+Este módulo implementa a classe LeitorDadosBrutos, responsável por ler
+incrementalmente o arquivo JSON gerado pelo Agente Coletor, mantendo em
+memória apenas uma página por vez.
+"""
+
+import json
+from utils.logger import setup_logger
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Configuração do logger
+logger = setup_logger('processador.leitor')
+
+# Eventos do ijson que correspondem a valores escalares
+_EVENTOS_ESCALARES = frozenset({'string', 'number', 'boolean', 'null'})
+
+class LeitorDadosBrutos:
+    """
+    Classe para leitura incremental dos dados brutos do DOU.
+    
+    Com o ijson disponível, as páginas e seções extras são lidas uma a uma
+    diretamente do arquivo. Sem ele, o arquivo é carregado inteiro com o
+    módulo json e os mesmos iteradores são servidos a partir da memória.
+    """
+    
+    # Campos de nível superior lidos antes das páginas
+    CAMPOS_CABECALHO = ('data', 'secao', 'total_paginas')
+    
+    def __init__(self, arquivo):
+        """
+        Inicializa o leitor de dados brutos.
+        
+        Args:
+            arquivo (str): Caminho para o arquivo JSON com dados brutos
+        """
+        self.arquivo = arquivo
+        self._dados = None
+        
+        if ijson is None:
+            logger.warning("Biblioteca ijson não encontrada. O arquivo será carregado inteiro em memória.")
+    
+    def _carregar(self):
+        """Carrega o arquivo inteiro (usado apenas sem o ijson)."""
+        if self._dados is None:
+            if orjson is not None:
+                with open(self.arquivo, 'rb') as f:
+                    self._dados = orjson.loads(f.read())
+            else:
+                with open(self.arquivo, 'r', encoding='utf-8') as f:
+                    self._dados = json.load(f)
+        return self._dados
+    
+    def ler_cabecalho(self):
+        """
+        Lê os campos de nível superior do arquivo (data, seção, total de páginas).
+        
+        A leitura para assim que os três campos são encontrados; como o Agente
+        Coletor os grava antes das listas, apenas o início do arquivo é lido.
+        
+        Returns:
+            dict: Campos do cabeçalho encontrados no arquivo
+        """
+        if ijson is None:
+            dados = self._carregar()
+            return {campo: dados[campo] for campo in self.CAMPOS_CABECALHO if campo in dados}
+        
+        cabecalho = {}
+        with open(self.arquivo, 'rb') as f:
+            for prefixo, evento, valor in ijson.parse(f, use_float=True):
+                if prefixo in self.CAMPOS_CABECALHO and evento in _EVENTOS_ESCALARES:
+                    cabecalho[prefixo] = valor
+                    if len(cabecalho) == len(self.CAMPOS_CABECALHO):
+                        break
+        
+        return cabecalho
+    
+    def iterar_itens(self, campos=('paginas', 'secoes_extras')):
+        """
+        Itera, em uma única passagem pelo arquivo, sobre os itens de listas de nível superior.
+        
+        Os itens são produzidos na ordem em que aparecem no arquivo, de modo
+        que as seções extras não exigem uma segunda leitura após as páginas.
+        
+        Args:
+            campos (tuple): Nomes das listas de nível superior
+            
+        Yields:
+            tuple: Pares (campo, item), um item por vez
+        """
+        if ijson is None:
+            dados = self._carregar()
+            for campo in campos:
+                for item in dados.get(campo) or []:
+                    yield campo, item
+            return
+        
+        # Prefixos dos itens das listas, como em ijson.items(f, 'campo.item')
+        alvos = {f'{campo}.item': campo for campo in campos}
+        
+        with open(self.arquivo, 'rb') as f:
+            construtor = None
+            prefixo_atual = None
+            for prefixo, evento, valor in ijson.parse(f, use_float=True):
+                if construtor is not None:
+                    construtor.event(evento, valor)
+                    # Os eventos internos do item têm prefixos mais longos
+                    if prefixo == prefixo_atual and evento in ('end_map', 'end_array'):
+                        yield alvos[prefixo_atual], construtor.value
+                        construtor = None
+                elif prefixo in alvos:
+                    if evento in ('start_map', 'start_array'):
+                        construtor = ijson.ObjectBuilder()
+                        construtor.event(evento, valor)
+                        prefixo_atual = prefixo
+                    elif evento in _EVENTOS_ESCALARES:
+                        yield alvos[prefixo], valor
@@ -7,7 +7,6 @@ usando técnicas de processamento de linguagem natural.
 """
 
 import argparse
-import json
 import os
 import sys
 from datetime import datetime
@@ -15,18 +14,30 @@ from datetime import datetime
 # Adiciona o diretório raiz ao path para importar módulos do projeto
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from processador.cache import CacheAnalises
+from processador.escritor import EscritorDadosProcessados
+from processador.leitor import LeitorDadosBrutos
 from processador.nlp import ProcessadorNLP
 from processador.resumo import GeradorResumo
-from utils.config import Config
+from utils.config import get_config
 from utils.logger import setup_logger
 
 # Configuração do logger
 logger = setup_logger('processador')
 
+# Publicações acumuladas (de várias páginas) antes de cada chamada ao spaCy:
+# lotes grandes permitem usar vários processos no nlp.pipe (ver
+# MIN_TEXTOS_MULTIPROCESSO) sem iniciar um novo pool a cada página
+PUBLICACOES_POR_LOTE = 2000
+
+# Versão da lógica de análise das publicações, incluída na chave do cache de
+# análises: deve ser incrementada sempre que a análise gerada mudar
+VERSAO_ANALISE = 1
+
 def parse_arguments():
     """Parse os argumentos da linha de comando."""
     parser = argparse.ArgumentParser(description='Agente Processador para o DOU')
-    parser.add_argument('--input', type=str, required=True,
+    parser.add_argument('--input', type=str,
                         help='Caminho para o arquivo JSON com dados brutos do DOU')
     parser.add_argument('--output', type=str,
                         help='Caminho para o arquivo de saída com dados processados')
@@ -36,146 +47,274 @@ def parse_arguments():
                         help='Tamanho máximo dos resumos gerados')
     parser.add_argument('--config', type=str,
                         help='Caminho para arquivo de configuração')
+    parser.add_argument('--sem-entidades', action='store_true',
+                        help='Usa apenas um tokenizador leve, sem carregar o modelo spaCy '
+                             '(classificação e palavras-chave, sem entidades)')
+    parser.add_argument('--serve', action='store_true',
+                        help='Mantém o modelo carregado e processa os arquivos '
+                             'cujos caminhos forem lidos da entrada padrão')
+    
+    args = parser.parse_args()
+    if not args.input and not args.serve:
+        parser.error('--input é obrigatório, exceto no modo --serve')
     
-    return parser.parse_args()
+    return args
 
-def main():
-    """Função principal do Agente Processador."""
-    args = parse_arguments()
+def processar_publicacoes(publicacoes_brutas, processador, gerador_resumo, cache=None):
+    """
+    Processa uma lista de publicações brutas.
     
-    # Carrega configurações
-    config = Config(args.config)
+    Textos idênticos são processados uma única vez: as análises já presentes
+    no cache são reaproveitadas e apenas os textos inéditos são enviados ao
+    spaCy, em lote (`nlp.pipe`). Cada resultado é então associado de volta
+    a todas as publicações com o mesmo texto.
+    
+    Args:
+        publicacoes_brutas (list): Publicações extraídas pelo Agente Coletor
+        processador (ProcessadorNLP): Processador NLP
+        gerador_resumo (GeradorResumo): Gerador de resumos
+        cache (CacheAnalises): Cache de análises; se None, a deduplicação
+            vale apenas dentro desta lista
+        
+    Returns:
+        list: Publicações processadas
+    """
+    if cache is None:
+        cache = CacheAnalises()
+    
+    chaves = [cache.chave(publicacao_bruta.get('corpo', '')) for publicacao_bruta in publicacoes_brutas]
+    
+    # Separa os textos que ainda precisam ser processados, sem repetições
+    analises = {}
+    pendentes = {}
+    for chave, publicacao_bruta in zip(chaves, publicacoes_brutas):
+        if chave in analises or chave in pendentes:
+            continue
+        analise = cache.get(chave)
+        if analise is None:
+            pendentes[chave] = publicacao_bruta.get('corpo', '')
+        else:
+            analises[chave] = analise
+    
+    for chave, doc in zip(pendentes, processador.processar_textos(list(pendentes.values()))):
+        analise = {
+            'resumo': gerador_resumo.gerar_resumo_de_doc(doc),
+            'entidades': processador.extrair_entidades(doc),
+            'palavras_chave': processador.extrair_palavras_chave(doc),
+            'tipo_documento': processador.classificar_documento(doc),
+            'metadados_extraidos': processador.extrair_metadados_texto(doc)
+        }
+        analises[chave] = analise
+        cache.set(chave, analise)
+    
+    return [
+        {
+            'id': publicacao_bruta.get('id', ''),
+            'titulo': publicacao_bruta.get('titulo', ''),
+            **analises[chave]
+        }
+        for chave, publicacao_bruta in zip(chaves, publicacoes_brutas)
+    ]
+
+def _publicacoes_do_item(campo, item_bruto):
+    """
+    Retorna as publicações brutas de uma página ou seção extra.
+    
+    Args:
+        campo (str): Lista de origem do item ('paginas' ou 'secoes_extras')
+        item_bruto (dict): Página ou seção extra bruta
+        
+    Returns:
+        list: Publicações brutas do item
+    """
+    if campo == 'paginas':
+        return item_bruto.get('publicacoes', [])
+    return item_bruto.get('conteudo', {}).get('publicacoes', [])
+
+def _agrupar_em_lotes(itens, publicacoes_por_lote):
+    """
+    Agrupa itens consecutivos até somarem o número de publicações desejado.
+    
+    Args:
+        itens (iterable): Pares (campo, item bruto)
+        publicacoes_por_lote (int): Número mínimo de publicações por lote
+            (exceto o último)
+        
+    Yields:
+        list: Lotes de pares (campo, item bruto)
+    """
+    lote = []
+    total = 0
+    for campo, item_bruto in itens:
+        lote.append((campo, item_bruto))
+        total += len(_publicacoes_do_item(campo, item_bruto))
+        if total >= publicacoes_por_lote:
+            yield lote
+            lote = []
+            total = 0
     
+    if lote:
+        yield lote
+
+def _processar_lote(lote, processador, gerador_resumo, cache):
+    """
+    Processa as publicações de um lote de itens em uma única chamada ao spaCy.
+    
+    Args:
+        lote (list): Pares (campo, item bruto)
+        processador (ProcessadorNLP): Processador NLP
+        gerador_resumo (GeradorResumo): Gerador de resumos
+        cache (CacheAnalises): Cache de análises de publicações
+        
+    Yields:
+        tuple: Pares (campo, item processado), na ordem do lote
+    """
+    publicacoes_brutas = [
+        publicacao
+        for campo, item_bruto in lote
+        for publicacao in _publicacoes_do_item(campo, item_bruto)
+    ]
+    publicacoes = processar_publicacoes(publicacoes_brutas, processador, gerador_resumo, cache)
+    
+    inicio = 0
+    for campo, item_bruto in lote:
+        fim = inicio + len(_publicacoes_do_item(campo, item_bruto))
+        yield campo, _montar_item(campo, item_bruto, publicacoes[inicio:fim])
+        inicio = fim
+
+def _montar_item(campo, item_bruto, publicacoes):
+    """
+    Monta uma página ou seção extra processada.
+    
+    Args:
+        campo (str): Lista de origem do item ('paginas' ou 'secoes_extras')
+        item_bruto (dict): Página ou seção extra bruta
+        publicacoes (list): Publicações já processadas do item
+        
+    Returns:
+        dict: Item processado
+    """
+    if campo == 'paginas':
+        return {
+            'numero_pagina': item_bruto.get('numero_pagina'),
+            'metadados': item_bruto.get('metadados', {}),
+            'publicacoes': publicacoes
+        }
+    
+    conteudo_bruto = item_bruto.get('conteudo', {})
+    return {
+        'url': item_bruto.get('url', ''),
+        'conteudo': {
+            'numero_pagina': conteudo_bruto.get('numero_pagina'),
+            'metadados': conteudo_bruto.get('metadados', {}),
+            'publicacoes': publicacoes
+        }
+    }
+
+def _contexto_cache(processador, gerador_resumo):
+    """
+    Identifica os parâmetros que determinam o resultado das análises.
+    
+    O contexto entra na chave do cache de análises, de modo que análises
+    geradas por outra versão do código, outro modelo (ou versão do modelo)
+    ou outras configurações não sejam reaproveitadas.
+    
+    Args:
+        processador (ProcessadorNLP): Processador NLP
+        gerador_resumo (GeradorResumo): Gerador de resumos
+        
+    Returns:
+        str: Contexto do cache de análises
+    """
+    return '|'.join(map(str, (
+        VERSAO_ANALISE,
+        processador.modelo,
+        processador.nlp.meta.get('version', ''),
+        ','.join(processador.exclude),
+        processador.sem_entidades,
+        gerador_resumo.tamanho_maximo,
+        gerador_resumo.metodo,
+        gerador_resumo.usar_punkt
+    )))
+
+def processar_arquivo(arquivo_entrada, arquivo_saida, processador, gerador_resumo, config, cache=None):
+    """
+    Processa um arquivo de dados brutos e grava o resultado.
+    
+    Args:
+        arquivo_entrada (str): Caminho para o arquivo JSON com dados brutos
+        arquivo_saida (str): Caminho para o arquivo de saída; se None, é
+            definido a partir do diretório de dados configurado
+        processador (ProcessadorNLP): Processador NLP
+        gerador_resumo (GeradorResumo): Gerador de resumos
+        config (Config): Configurações do sistema
+        cache (CacheAnalises): Cache de análises de publicações
+        
+    Returns:
+        int: 0 em caso de sucesso, 1 em caso de erro
+    """
     # Verifica se o arquivo de entrada existe
-    if not os.path.exists(args.input):
-        logger.error(f"Arquivo de entrada não encontrado: {args.input}")
+    if not os.path.exists(arquivo_entrada):
+        logger.error(f"Arquivo de entrada não encontrado: {arquivo_entrada}")
         return 1
     
     # Define arquivo de saída
-    if args.output:
-        output_file = args.output
-    else:
-        input_basename = os.path.basename(args.input)
+    if not arquivo_saida:
+        input_basename = os.path.basename(arquivo_entrada)
         output_dir = os.path.join(config.get('dados_dir', '../dados'), 'processados')
         os.makedirs(output_dir, exist_ok=True)
-        output_file = os.path.join(output_dir, f"processado_{input_basename}")
+        arquivo_saida = os.path.join(output_dir, f"processado_{input_basename}")
     
-    # Carrega os dados brutos
-    logger.info(f"Carregando dados brutos de {args.input}")
+    # Lê o cabeçalho dos dados brutos; páginas e seções extras são lidas sob demanda
+    logger.info(f"Carregando dados brutos de {arquivo_entrada}")
+    leitor = LeitorDadosBrutos(arquivo_entrada)
     try:
-        with open(args.input, 'r', encoding='utf-8') as f:
-            dados_brutos = json.load(f)
+        cabecalho = leitor.ler_cabecalho()
     except Exception as e:
         logger.error(f"Erro ao carregar arquivo de entrada: {str(e)}")
         return 1
     
-    # Inicializa o processador NLP
-    modelo = args.modelo or config.get('modelo_spacy', 'pt_core_news_lg')
-    processador = ProcessadorNLP(modelo=modelo)
-    
-    # Inicializa o gerador de resumos
-    tamanho_resumo = args.tamanho_resumo or config.get('tamanho_maximo_resumo', 200)
-    gerador_resumo = GeradorResumo(tamanho_maximo=tamanho_resumo)
-    
     # Processa os dados
     logger.info("Iniciando processamento dos dados")
     try:
         # Extrai metadados gerais
-        dados_processados = {
-            'data': dados_brutos.get('data'),
-            'secao': dados_brutos.get('secao'),
-            'total_paginas': dados_brutos.get('total_paginas'),
-            'timestamp_processamento': datetime.now().isoformat(),
-            'paginas': []
+        cabecalho_processado = {
+            'data': cabecalho.get('data'),
+            'secao': cabecalho.get('secao'),
+            'total_paginas': cabecalho.get('total_paginas'),
+            'timestamp_processamento': datetime.now().isoformat()
         }
         
-        # Processa cada página
-        total_paginas = len(dados_brutos.get('paginas', []))
-        logger.info(f"Processando {total_paginas} páginas")
-        
-        for i, pagina_bruta in enumerate(dados_brutos.get('paginas', []), 1):
-            logger.info(f"Processando página {i}/{total_paginas}")
-            
-            # Extrai metadados da página
-            pagina_processada = {
-                'numero_pagina': pagina_bruta.get('numero_pagina'),
-                'metadados': pagina_bruta.get('metadados', {}),
-                'publicacoes': []
-            }
-            
-            # Processa cada publicação da página
-            for publicacao_bruta in pagina_bruta.get('publicacoes', []):
-                # Processa o texto da publicação
-                texto = publicacao_bruta.get('corpo', '')
-                doc = processador.processar_texto(texto)
-                
-                # Extrai entidades
-                entidades = processador.extrair_entidades(doc)
-                
-                # Gera resumo
-                resumo = gerador_resumo.gerar_resumo(texto)
-                
-                # Extrai palavras-chave
-                palavras_chave = processador.extrair_palavras_chave(doc)
-                
-                # Classifica o tipo de documento
-                tipo_documento = processador.classificar_documento(doc)
-                
-                # Monta a publicação processada
-                publicacao_processada = {
-                    'id': publicacao_bruta.get('id', ''),
-                    'titulo': publicacao_bruta.get('titulo', ''),
-                    'resumo': resumo,
-                    'entidades': entidades,
-                    'palavras_chave': palavras_chave,
-                    'tipo_documento': tipo_documento,
-                    'metadados_extraidos': processador.extrair_metadados_texto(doc)
-                }
-                
-                pagina_processada['publicacoes'].append(publicacao_processada)
-            
-            dados_processados['paginas'].append(pagina_processada)
+        # Grava cada página no arquivo de saída assim que é processada
+        logger.info(f"Salvando dados processados em {arquivo_saida}")
+        total_paginas = 0
+        total_publicacoes = 0
         
-        # Processa seções extras, se existirem
-        if 'secoes_extras' in dados_brutos and dados_brutos['secoes_extras']:
-            dados_processados['secoes_extras'] = []
+        with EscritorDadosProcessados(arquivo_saida, cabecalho_processado) as escritor:
+            # Processa páginas e seções extras em uma única leitura do arquivo
+            # de entrada, em lotes de itens, na ordem em que aparecem
+            total_informado = cabecalho.get('total_paginas') or '?'
+            logger.info(f"Processando {total_informado} páginas")
             
-            for secao_extra in dados_brutos['secoes_extras']:
-                secao_processada = {
-                    'url': secao_extra.get('url', ''),
-                    'conteudo': {}
-                }
-                
-                conteudo_bruto = secao_extra.get('conteudo', {})
-                conteudo_processado = {
-                    'numero_pagina': conteudo_bruto.get('numero_pagina'),
-                    'metadados': conteudo_bruto.get('metadados', {}),
-                    'publicacoes': []
-                }
-                
-                for publicacao_bruta in conteudo_bruto.get('publicacoes', []):
-                    texto = publicacao_bruta.get('corpo', '')
-                    doc = processador.processar_texto(texto)
+            lista_atual = None
+            itens = leitor.iterar_itens(('paginas', 'secoes_extras'))
+            for lote in _agrupar_em_lotes(itens, PUBLICACOES_POR_LOTE):
+                # Todas as publicações do lote são enviadas ao spaCy de uma vez
+                for campo, item_processado in _processar_lote(lote, processador, gerador_resumo, cache):
+                    if campo != lista_atual:
+                        escritor.iniciar_lista(campo)
+                        lista_atual = campo
                     
-                    publicacao_processada = {
-                        'id': publicacao_bruta.get('id', ''),
-                        'titulo': publicacao_bruta.get('titulo', ''),
-                        'resumo': gerador_resumo.gerar_resumo(texto),
-                        'entidades': processador.extrair_entidades(doc),
-                        'palavras_chave': processador.extrair_palavras_chave(doc),
-                        'tipo_documento': processador.classificar_documento(doc),
-                        'metadados_extraidos': processador.extrair_metadados_texto(doc)
-                    }
+                    if campo == 'paginas':
+                        total_paginas += 1
+                        total_publicacoes += len(item_processado['publicacoes'])
+                        logger.info(f"Página {total_paginas}/{total_informado} processada")
                     
-                    conteudo_processado['publicacoes'].append(publicacao_processada)
-                
-                secao_processada['conteudo'] = conteudo_processado
-                dados_processados['secoes_extras'].append(secao_processada)
-        
-        # Salva os dados processados
-        logger.info(f"Salvando dados processados em {output_file}")
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(dados_processados, f, ensure_ascii=False, indent=2)
+                    escritor.escrever_item(item_processado)
+            
+            # A lista de páginas está sempre presente na saída, mesmo vazia
+            if total_paginas == 0:
+                escritor.iniciar_lista('paginas')
         
         # Notifica o Agente Coordenador sobre a conclusão
         if config.get('usar_mensageria', False):
@@ -183,12 +322,12 @@ def main():
             publicar_mensagem(
                 'processamento_concluido',
                 {
-                    'data': dados_brutos.get('data'),
-                    'secao': dados_brutos.get('secao'),
-                    'arquivo_entrada': args.input,
-                    'arquivo_saida': output_file,
+                    'data': cabecalho.get('data'),
+                    'secao': cabecalho.get('secao'),
+                    'arquivo_entrada': arquivo_entrada,
+                    'arquivo_saida': arquivo_saida,
                     'total_paginas': total_paginas,
-                    'total_publicacoes': sum(len(p.get('publicacoes', [])) for p in dados_processados['paginas']),
+                    'total_publicacoes': total_publicacoes,
                     'timestamp': datetime.now().isoformat()
                 }
             )
@@ -200,5 +339,66 @@ def main():
         logger.error(f"Erro durante o processamento: {str(e)}")
         return 1
 
+def servir(processador, gerador_resumo, config, cache=None):
+    """
+    Executa o processador em modo contínuo.
+    
+    Lê caminhos de arquivos de entrada da entrada padrão, um por linha, e
+    processa cada um reutilizando o mesmo modelo spaCy já carregado.
+    
+    Args:
+        processador (ProcessadorNLP): Processador NLP
+        gerador_resumo (GeradorResumo): Gerador de resumos
+        config (Config): Configurações do sistema
+        cache (CacheAnalises): Cache de análises de publicações
+        
+    Returns:
+        int: 0 se todos os arquivos foram processados, 1 se algum falhou
+    """
+    logger.info("Modo serviço: aguardando caminhos de arquivos na entrada padrão")
+    
+    status = 0
+    for linha in sys.stdin:
+        arquivo_entrada = linha.strip()
+        if not arquivo_entrada:
+            continue
+        
+        if processar_arquivo(arquivo_entrada, None, processador, gerador_resumo, config, cache) != 0:
+            status = 1
+    
+    return status
+
+def main():
+    """Função principal do Agente Processador."""
+    args = parse_arguments()
+    
+    # Carrega configurações
+    config = get_config(args.config)
+    
+    # Verifica se o arquivo de entrada existe antes de carregar o modelo
+    if not args.serve and not os.path.exists(args.input):
+        logger.error(f"Arquivo de entrada não encontrado: {args.input}")
+        return 1
+    
+    # Inicializa o processador NLP
+    modelo = args.modelo or config.get('modelo_spacy', 'pt_core_news_lg')
+    processador = ProcessadorNLP(modelo=modelo, sem_entidades=args.sem_entidades)
+    
+    # Inicializa o gerador de resumos
+    tamanho_resumo = args.tamanho_resumo or config.get('tamanho_maximo_resumo', 200)
+    gerador_resumo = GeradorResumo(tamanho_maximo=tamanho_resumo)
+    
+    # Inicializa o cache de análises, que evita reprocessar textos repetidos
+    # (em disco apenas se habilitado para o processador)
+    cache_dir = None
+    if config.get('usar_cache_processador', False):
+        cache_dir = os.path.join(config.get('cache_dir'), 'processador')
+    cache = CacheAnalises(cache_dir, contexto=_contexto_cache(processador, gerador_resumo))
+    
+    if args.serve:
+        return servir(processador, gerador_resumo, config, cache)
+    
+    return processar_arquivo(args.input, args.output, processador, gerador_resumo, config, cache)
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -5,14 +5,81 @@ Este módulo implementa a classe ProcessadorNLP, responsável por aplicar
 técnicas de processamento de linguagem natural aos textos do DOU.
 """
 
+import functools
+import os
 import re
+import sys
+
+# Evita sobrecarga de threads do BLAS quando o nlp.pipe usa vários processos
+os.environ.setdefault('OPENBLAS_NUM_THREADS', '1')
+os.environ.setdefault('MKL_NUM_THREADS', '1')
+
 import spacy
 from collections import Counter
+from spacy.matcher import PhraseMatcher
 from utils.logger import setup_logger
 
 # Configuração do logger
 logger = setup_logger('processador.nlp')
 
+# Usa a GPU (backend cupy do Thinc) quando disponível; precisa ocorrer antes
+# de qualquer spacy.load para que os pesos sejam alocados na GPU
+try:
+    import cupy  # noqa: F401
+    USANDO_GPU = spacy.prefer_gpu()
+except Exception:
+    USANDO_GPU = False
+
+if USANDO_GPU:
+    logger.info("spaCy executando na GPU")
+
+# Padrão usado no pré-processamento do texto
+_RE_WS = re.compile(r'\s+')
+
+# Padrões de metadados combinados em uma única alternância com grupos nomeados
+# (os nomes dos grupos são as chaves do dicionário de metadados). CNPJ e CPF
+# vêm antes de processo porque um CNPJ sem pontos também casaria com ele.
+_RE_METADADOS = re.compile(
+    r'(?P<datas>\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b)'
+    r'|(?P<valores_monetarios>R\$\s*\d+(?:[.,]\d+)*)'
+    r'|(?P<cnpj>\b\d{2}\.?\d{3}\.?\d{3}/\d{4}-\d{2}\b)'
+    r'|(?P<cpf>\b\d{3}\.?\d{3}\.?\d{3}-\d{2}\b)'
+    r'|(?P<numeros_processos>\b\d{5,7}[-.]?\d{3,}[/.]?\d{4}[-.]?\d{1,2}\b)'
+)
+
+# Abaixo deste número de textos o custo de criar processos supera o ganho
+MIN_TEXTOS_MULTIPROCESSO = 200
+
+# Textos por lote no nlp.pipe: lotes maiores aproveitam melhor a GPU
+BATCH_SIZE_CPU = 64
+BATCH_SIZE_GPU = 256
+
+@functools.lru_cache(maxsize=2)
+def _carregar_modelo(modelo, exclude):
+    """
+    Carrega um modelo spaCy sem os componentes excluídos.
+    
+    O pipeline carregado fica em cache no processo, de modo que novas
+    instâncias de ProcessadorNLP com o mesmo modelo não o recarregam.
+    
+    Args:
+        modelo (str): Nome do modelo spaCy
+        exclude (tuple): Componentes do pipeline a não carregar
+        
+    Returns:
+        spacy.language.Language: Pipeline carregado
+    """
+    nlp = spacy.load(modelo, exclude=list(exclude))
+    
+    # Sem o parser, usa o senter (desabilitado por padrão) para as sentenças
+    if 'parser' not in nlp.pipe_names and 'senter' in nlp.disabled:
+        nlp.enable_pipe('senter')
+    
+    # Executa o pipeline uma vez para carregar os pesos antes do primeiro texto
+    nlp("aquecimento")
+    
+    return nlp
+
 class ProcessadorNLP:
     """
     Classe para processamento de linguagem natural dos textos do DOU.
@@ -27,21 +94,58 @@ class ProcessadorNLP:
         'portaria', 'decreto', 'resolucao', 'despacho', 'outros'
     ]
     
-    def __init__(self, modelo='pt_core_news_lg'):
+    # Cópia imutável dos tipos, usada para iniciar as pontuações a cada chamada
+    _TIPOS = tuple(TIPOS_DOCUMENTO)
+    
+    # Palavras-chave que indicam cada tipo de documento
+    PALAVRAS_CHAVE_TIPOS = {
+        'licitacao': ('licitação', 'pregão', 'concorrência', 'tomada de preço', 'licitatório'),
+        'contrato': ('contrato', 'termo aditivo', 'contratante', 'contratado'),
+        'extrato': ('extrato', 'resumo'),
+        'aviso': ('aviso', 'comunicado', 'informa'),
+        'edital': ('edital', 'seleção', 'processo seletivo'),
+        'portaria': ('portaria', 'nomear', 'designar', 'exonerar'),
+        'decreto': ('decreto', 'decreta'),
+        'resolucao': ('resolução', 'resolve'),
+        'despacho': ('despacho', 'decide')
+    }
+    
+    # Componentes do pipeline não utilizados pelo processador. Nos modelos
+    # em português o POS vem do morphologizer, do qual o lemmatizer depende,
+    # então apenas o parser é descartado (o senter fornece as sentenças).
+    COMPONENTES_EXCLUIDOS = ('parser',)
+    
+    def __init__(self, modelo='pt_core_news_lg', exclude=COMPONENTES_EXCLUIDOS, sem_entidades=False):
         """
         Inicializa o processador NLP.
         
         Args:
             modelo (str): Nome do modelo spaCy a ser utilizado
+            exclude (iterable): Componentes do pipeline a não carregar
+            sem_entidades (bool): Se True, usa apenas o tokenizador de
+                `spacy.blank("pt")`, sem carregar o modelo; serve para
+                classificação e palavras-chave por frequência, sem entidades
         """
+        self.exclude = tuple(exclude)
+        self.sem_entidades = sem_entidades
+        
+        if sem_entidades:
+            self.modelo = 'blank:pt'
+            self.nlp = spacy.blank('pt')
+            logger.info("Usando pipeline leve (spacy.blank('pt')); entidades não serão extraídas")
+            self.configurar_pipeline()
+            return
+        
+        self.modelo = modelo
         try:
-            self.nlp = spacy.load(modelo)
+            self.nlp = _carregar_modelo(modelo, self.exclude)
             logger.info(f"Modelo spaCy '{modelo}' carregado com sucesso")
         except Exception as e:
             logger.error(f"Erro ao carregar modelo spaCy '{modelo}': {str(e)}")
             logger.warning("Tentando carregar modelo alternativo 'pt_core_news_sm'")
             try:
-                self.nlp = spacy.load('pt_core_news_sm')
+                self.nlp = _carregar_modelo('pt_core_news_sm', self.exclude)
+                self.modelo = 'pt_core_news_sm'
                 logger.info("Modelo alternativo carregado com sucesso")
             except Exception as e2:
                 logger.error(f"Erro ao carregar modelo alternativo: {str(e2)}")
@@ -49,7 +153,8 @@ class ProcessadorNLP:
                 try:
                     import subprocess
                     subprocess.run([sys.executable, "-m", "spacy", "download", "pt_core_news_sm"], check=True)
-                    self.nlp = spacy.load('pt_core_news_sm')
+                    self.nlp = _carregar_modelo('pt_core_news_sm', self.exclude)
+                    self.modelo = 'pt_core_news_sm'
                     logger.info("Modelo baixado e carregado com sucesso")
                 except Exception as e3:
                     logger.critical(f"Falha ao baixar e carregar modelo: {str(e3)}")
@@ -60,8 +165,13 @@ class ProcessadorNLP:
     
     def configurar_pipeline(self):
         """Configura o pipeline de processamento do spaCy."""
-        # Adiciona componentes personalizados se necessário
-        pass
+        # Matcher das palavras-chave de classificação, sem distinguir maiúsculas
+        self._matcher = PhraseMatcher(self.nlp.vocab, attr='LOWER')
+        for tipo, palavras in self.PALAVRAS_CHAVE_TIPOS.items():
+            self._matcher.add(tipo, [self.nlp.make_doc(palavra) for palavra in palavras])
+        
+        # Tabela hash do padrão -> tipo, evitando consultar o StringStore a cada ocorrência
+        self._tipo_por_match_id = {self.nlp.vocab.strings[tipo]: tipo for tipo in self.PALAVRAS_CHAVE_TIPOS}
     
     def processar_texto(self, texto):
         """
@@ -79,6 +189,35 @@ class ProcessadorNLP:
         # Processa o texto com o spaCy
         return self.nlp(texto)
     
+    def processar_textos(self, textos, batch_size=None, n_process=None):
+        """
+        Processa vários textos em lote usando `nlp.pipe` do spaCy.
+        
+        Args:
+            textos (list): Textos a serem processados
+            batch_size (int): Número de textos por lote; por padrão
+                BATCH_SIZE_GPU na GPU e BATCH_SIZE_CPU na CPU
+            n_process (int): Número de processos; por padrão usa até 4 CPUs,
+                ou apenas 1 quando há poucos textos. Na GPU é sempre 1
+            
+        Returns:
+            iterator: Documentos processados pelo spaCy, na ordem dos textos
+        """
+        if batch_size is None:
+            batch_size = BATCH_SIZE_GPU if USANDO_GPU else BATCH_SIZE_CPU
+        
+        if USANDO_GPU:
+            # Vários processos disputando uma única GPU apenas serializam o trabalho
+            n_process = 1
+        elif n_process is None:
+            if len(textos) < MIN_TEXTOS_MULTIPROCESSO:
+                n_process = 1
+            else:
+                n_process = min(os.cpu_count() or 1, 4)
+        
+        textos_pre_processados = (self._pre_processar_texto(texto) for texto in textos)
+        return self.nlp.pipe(textos_pre_processados, batch_size=batch_size, n_process=n_process)
+    
     def _pre_processar_texto(self, texto):
         """
         Realiza pré-processamento no texto antes de enviá-lo ao spaCy.
@@ -90,7 +229,7 @@ class ProcessadorNLP:
             str: Texto pré-processado
         """
         # Remove caracteres especiais e normaliza espaços
-        texto = re.sub(r'\s+', ' ', texto)
+        texto = _RE_WS.sub(' ', texto)
         texto = texto.strip()
         
         return texto
@@ -128,11 +267,17 @@ class ProcessadorNLP:
         Returns:
             list: Lista de palavras-chave com pontuação
         """
-        # Filtra tokens relevantes (substantivos, verbos, adjetivos)
-        tokens = [token.lemma_ for token in doc 
-                 if not token.is_stop and not token.is_punct and not token.is_space
-                 and token.pos_ in ('NOUN', 'VERB', 'ADJ') 
-                 and len(token.text) > 3]
+        if doc.has_annotation('POS'):
+            # Filtra tokens relevantes (substantivos, verbos, adjetivos)
+            tokens = [token.lemma_ for token in doc 
+                     if not token.is_stop and not token.is_punct and not token.is_space
+                     and token.pos_ in ('NOUN', 'VERB', 'ADJ') 
+                     and len(token.text) > 3]
+        else:
+            # Sem POS/lemas (pipeline leve), usa a frequência das formas em minúsculas
+            tokens = [token.lower_ for token in doc 
+                     if not token.is_stop and not token.is_punct and not token.is_space
+                     and len(token.text) > 3]
         
         # Conta frequência
         contador = Counter(tokens)
@@ -159,25 +304,9 @@ class ProcessadorNLP:
             'cpf': []
         }
         
-        # Extrai datas
-        padrao_data = r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b'
-        metadados['datas'] = re.findall(padrao_data, doc.text)
-        
-        # Extrai valores monetários
-        padrao_valor = r'R\$\s*\d+(?:[.,]\d+)*'
-        metadados['valores_monetarios'] = re.findall(padrao_valor, doc.text)
-        
-        # Extrai números de processos
-        padrao_processo = r'\b\d{5,7}[-.]?\d{3,}[/.]?\d{4}[-.]?\d{1,2}\b'
-        metadados['numeros_processos'] = re.findall(padrao_processo, doc.text)
-        
-        # Extrai CNPJ
-        padrao_cnpj = r'\b\d{2}\.?\d{3}\.?\d{3}/\d{4}-\d{2}\b'
-        metadados['cnpj'] = re.findall(padrao_cnpj, doc.text)
-        
-        # Extrai CPF
-        padrao_cpf = r'\b\d{3}\.?\d{3}\.?\d{3}-\d{2}\b'
-        metadados['cpf'] = re.findall(padrao_cpf, doc.text)
+        # Extrai todos os tipos de metadados em uma única varredura do texto
+        for match in _RE_METADADOS.finditer(doc.text):
+            metadados[match.lastgroup].append(match.group())
         
         return metadados
     
@@ -191,34 +320,19 @@ class ProcessadorNLP:
         Returns:
             str: Tipo de documento identificado
         """
-        texto_lower = doc.text.lower()
-        
-        # Palavras-chave para cada tipo de documento
-        keywords = {
-            'licitacao': ['licitação', 'pregão', 'concorrência', 'tomada de preço', 'licitatório'],
-            'contrato': ['contrato', 'termo aditivo', 'contratante', 'contratado'],
-            'extrato': ['extrato', 'resumo'],
-            'aviso': ['aviso', 'comunicado', 'informa'],
-            'edital': ['edital', 'seleção', 'processo seletivo'],
-            'portaria': ['portaria', 'nomear', 'designar', 'exonerar'],
-            'decreto': ['decreto', 'decreta'],
-            'resolucao': ['resolução', 'resolve'],
-            'despacho': ['despacho', 'decide']
-        }
-        
-        # Conta ocorrências de palavras-chave para cada tipo
-        scores = {tipo: 0 for tipo in self.TIPOS_DOCUMENTO}
+        # Conta ocorrências de palavras-chave para cada tipo em uma única varredura
+        # dos tokens (atributo LOWER), sem criar uma cópia do texto em minúsculas
+        scores = dict.fromkeys(self._TIPOS, 0)
+        tipo_por_match_id = self._tipo_por_match_id
         
-        for tipo, palavras in keywords.items():
-            for palavra in palavras:
-                if palavra in texto_lower:
-                    scores[tipo] += texto_lower.count(palavra)
+        for match_id, _, _ in self._matcher(doc):
+            scores[tipo_por_match_id[match_id]] += 1
         
         # Identifica o tipo com maior pontuação
-        tipo_max = max(scores.items(), key=lambda x: x[1])
+        tipo_max = max(scores, key=scores.__getitem__)
         
         # Se nenhum tipo teve pontuação, classifica como 'outros'
-        if tipo_max[1] == 0:
+        if scores[tipo_max] == 0:
             return 'outros'
         
-        return tipo_max[0]
+        return tipo_max
@@ -5,16 +5,59 @@ Este módulo implementa a classe GeradorResumo, responsável por
 criar resumos automáticos dos textos extraídos do DOU.
 """
 
+import heapq
 import re
-import nltk
-from nltk.tokenize import sent_tokenize
-from nltk.corpus import stopwords
-from nltk.probability import FreqDist
+from collections import Counter
 from utils.logger import setup_logger
 
+try:
+    import nltk
+    from nltk.tokenize import sent_tokenize
+except ImportError:
+    nltk = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Configuração do logger
 logger = setup_logger('processador.resumo')
 
+# Padrões usados no pré-processamento, na tokenização e na separação de sentenças
+_RE_WS = re.compile(r'\s+')
+_RE_PUNCT = re.compile(r'[^\w\s]')
+_RE_SENT = re.compile(r'[.!?]+')
+
+# Stopwords em português (mesma lista do corpus do NLTK, sem depender dele)
+_STOPWORDS = frozenset({
+    'a', 'à', 'ao', 'aos', 'aquela', 'aquelas', 'aquele', 'aqueles', 'aquilo', 'as',
+    'às', 'até', 'com', 'como', 'da', 'das', 'de', 'dela', 'delas', 'dele', 'deles',
+    'depois', 'do', 'dos', 'e', 'é', 'ela', 'elas', 'ele', 'eles', 'em', 'entre',
+    'era', 'eram', 'éramos', 'essa', 'essas', 'esse', 'esses', 'esta', 'está',
+    'estamos', 'estão', 'estar', 'estas', 'estava', 'estavam', 'estávamos', 'este',
+    'esteja', 'estejam', 'estejamos', 'estes', 'esteve', 'estive', 'estivemos',
+    'estiver', 'estivera', 'estiveram', 'estivéramos', 'estiverem', 'estivermos',
+    'estivesse', 'estivessem', 'estivéssemos', 'estou', 'eu', 'foi', 'fomos', 'for',
+    'fora', 'foram', 'fôramos', 'forem', 'formos', 'fosse', 'fossem', 'fôssemos',
+    'fui', 'há', 'haja', 'hajam', 'hajamos', 'hão', 'havemos', 'haver', 'hei',
+    'houve', 'houvemos', 'houver', 'houvera', 'houverá', 'houveram', 'houvéramos',
+    'houverão', 'houverei', 'houverem', 'houveremos', 'houveria', 'houveriam',
+    'houveríamos', 'houvermos', 'houvesse', 'houvessem', 'houvéssemos', 'isso',
+    'isto', 'já', 'lhe', 'lhes', 'mais', 'mas', 'me', 'mesmo', 'meu', 'meus',
+    'minha', 'minhas', 'muito', 'na', 'não', 'nas', 'nem', 'no', 'nos', 'nós',
+    'nossa', 'nossas', 'nosso', 'nossos', 'num', 'numa', 'o', 'os', 'ou', 'para',
+    'pela', 'pelas', 'pelo', 'pelos', 'por', 'qual', 'quando', 'que', 'quem', 'são',
+    'se', 'seja', 'sejam', 'sejamos', 'sem', 'ser', 'será', 'serão', 'serei',
+    'seremos', 'seria', 'seriam', 'seríamos', 'seu', 'seus', 'só', 'somos', 'sou',
+    'sua', 'suas', 'também', 'te', 'tem', 'tém', 'temos', 'tenha', 'tenham',
+    'tenhamos', 'tenho', 'terá', 'terão', 'terei', 'teremos', 'teria', 'teriam',
+    'teríamos', 'teu', 'teus', 'teve', 'tinha', 'tinham', 'tínhamos', 'tive',
+    'tivemos', 'tiver', 'tivera', 'tiveram', 'tivéramos', 'tiverem', 'tivermos',
+    'tivesse', 'tivessem', 'tivéssemos', 'tu', 'tua', 'tuas', 'um', 'uma', 'você',
+    'vocês', 'vos'
+})
+
 class GeradorResumo:
     """
     Classe para geração de resumos automáticos dos textos do DOU.
@@ -33,50 +76,17 @@ class GeradorResumo:
         """
         self.tamanho_maximo = tamanho_maximo
         self.metodo = metodo
+        self.stopwords = _STOPWORDS
         
-        # Inicializa recursos do NLTK
-        try:
-            # Verifica se os recursos necessários estão disponíveis
-            nltk.data.find('tokenizers/punkt')
-            nltk.data.find('corpora/stopwords')
-        except LookupError:
-            logger.warning("Recursos do NLTK não encontrados. Tentando baixar...")
+        # As sentenças normalmente vêm do spaCy (gerar_resumo_de_doc); o punkt
+        # do NLTK é usado apenas no resumo a partir de texto, se já instalado
+        self.usar_punkt = False
+        if nltk is not None:
             try:
-                nltk.download('punkt')
-                nltk.download('stopwords')
-                logger.info("Recursos do NLTK baixados com sucesso")
-            except Exception as e:
-                logger.error(f"Erro ao baixar recursos do NLTK: {str(e)}")
-                logger.warning("Usando métodos alternativos para tokenização e stopwords")
-        
-        # Carrega stopwords em português
-        try:
-            self.stopwords = set(stopwords.words('portuguese'))
-        except:
-            # Fallback para lista básica de stopwords em português
-            self.stopwords = {
-                'a', 'ao', 'aos', 'aquela', 'aquelas', 'aquele', 'aqueles', 'aquilo', 'as', 'até',
-                'com', 'como', 'da', 'das', 'de', 'dela', 'delas', 'dele', 'deles', 'depois',
-                'do', 'dos', 'e', 'ela', 'elas', 'ele', 'eles', 'em', 'entre', 'era',
-                'eram', 'éramos', 'essa', 'essas', 'esse', 'esses', 'esta', 'estas', 'este',
-                'esteja', 'estejam', 'estejamos', 'estes', 'esteve', 'estive', 'estivemos',
-                'estiver', 'estivera', 'estiveram', 'estiverem', 'estivermos', 'estou', 'eu',
-                'foi', 'fomos', 'for', 'fora', 'foram', 'forem', 'formos', 'fosse', 'fossem',
-                'fui', 'há', 'haja', 'hajam', 'hajamos', 'hão', 'havemos', 'hei', 'houve',
-                'houvemos', 'houver', 'houvera', 'houveram', 'houverei', 'houverem', 'houveremos',
-                'houveria', 'houveriam', 'houvermos', 'houverá', 'houverão', 'houveríamos',
-                'houverão', 'houvesse', 'houvessem', 'houvéramos', 'houvéssemos', 'isso', 'isto',
-                'já', 'lhe', 'lhes', 'mais', 'mas', 'me', 'mesmo', 'meu', 'meus', 'minha',
-                'minhas', 'muito', 'na', 'nas', 'nem', 'no', 'nos', 'nós', 'nossa', 'nossas',
-                'nosso', 'nossos', 'num', 'numa', 'o', 'os', 'ou', 'para', 'pela', 'pelas',
-                'pelo', 'pelos', 'por', 'qual', 'quando', 'que', 'quem', 'são', 'se', 'seja',
-                'sejam', 'sejamos', 'sem', 'será', 'serão', 'seria', 'seriam', 'seríamos',
-                'seu', 'seus', 'só', 'somos', 'sou', 'sua', 'suas', 'também', 'te', 'tem',
-                'tém', 'temos', 'tenha', 'tenham', 'tenhamos', 'tenho', 'terá', 'terão',
-                'teria', 'teriam', 'teríamos', 'teu', 'teus', 'teve', 'tinha', 'tinham',
-                'tínhamos', 'tive', 'tivemos', 'tiver', 'tivera', 'tiveram', 'tiverem',
-                'tivermos', 'tu', 'tua', 'tuas', 'um', 'uma', 'você', 'vocês', 'vos'
-            }
+                nltk.data.find('tokenizers/punkt')
+                self.usar_punkt = True
+            except LookupError:
+                logger.debug("Tokenizador punkt do NLTK não encontrado. Usando separação simples de sentenças")
     
     def gerar_resumo(self, texto):
         """
@@ -97,6 +107,42 @@ class GeradorResumo:
             # Fallback para método extrativo se o abstrativo não estiver implementado
             return self._resumo_extrativo(texto)
     
+    def gerar_resumo_de_doc(self, doc):
+        """
+        Gera um resumo a partir de um documento já processado pelo spaCy.
+        
+        Reaproveita as sentenças (`doc.sents`) e os lemas do documento, evitando
+        tokenizar novamente o texto. Se o documento não tiver limites de
+        sentença, recorre ao resumo baseado em texto.
+        
+        Args:
+            doc (spacy.tokens.Doc): Documento processado pelo spaCy
+            
+        Returns:
+            str: Resumo gerado
+        """
+        texto = doc.text
+        if not texto or len(texto) <= self.tamanho_maximo:
+            return texto
+        
+        if not doc.has_annotation('SENT_START'):
+            return self.gerar_resumo(texto)
+        
+        sentencas = []
+        palavras_por_sentenca = []
+        for sent in doc.sents:
+            sentenca = sent.text.strip()
+            if not sentenca:
+                continue
+            sentencas.append(sentenca)
+            palavras_por_sentenca.append([
+                token.lemma_.lower() for token in sent
+                if not token.is_stop and not token.is_punct and not token.is_space
+                and len(token.text) > 3
+            ])
+        
+        return self._resumo_de_sentencas(sentencas, palavras_por_sentenca)
+    
     def _resumo_extrativo(self, texto):
         """
         Gera um resumo extrativo selecionando as sentenças mais importantes.
@@ -110,14 +156,33 @@ class GeradorResumo:
         # Pré-processamento do texto
         texto = self._pre_processar_texto(texto)
         
-        try:
-            # Tokeniza o texto em sentenças
-            sentencas = sent_tokenize(texto, language='portuguese')
-        except:
+        sentencas = None
+        if self.usar_punkt:
+            try:
+                # Tokeniza o texto em sentenças
+                sentencas = sent_tokenize(texto, language='portuguese')
+            except Exception:
+                sentencas = None
+        
+        if sentencas is None:
             # Fallback para tokenização simples
-            sentencas = re.split(r'[.!?]+', texto)
+            sentencas = _RE_SENT.split(texto)
             sentencas = [s.strip() for s in sentencas if s.strip()]
         
+        return self._resumo_de_sentencas(sentencas)
+    
+    def _resumo_de_sentencas(self, sentencas, palavras_por_sentenca=None):
+        """
+        Monta o resumo extrativo a partir das sentenças do texto.
+        
+        Args:
+            sentencas (list): Lista de sentenças
+            palavras_por_sentenca (list): Palavras relevantes de cada sentença;
+                se None, as sentenças são tokenizadas
+            
+        Returns:
+            str: Resumo extrativo
+        """
         if not sentencas:
             return ""
         
@@ -126,26 +191,29 @@ class GeradorResumo:
             return self._truncar_texto(sentencas[0])
         
         # Calcula a pontuação de cada sentença
-        pontuacoes = self._pontuar_sentencas(sentencas)
+        pontuacoes = self._pontuar_sentencas(sentencas, palavras_por_sentenca)
         
-        # Ordena as sentenças por pontuação
-        sentencas_ordenadas = [sent for _, sent in sorted(
-            zip(pontuacoes, sentencas), 
-            key=lambda x: x[0], 
-            reverse=True
-        )]
+        # Seleciona apenas as k sentenças de maior pontuação (k estimado a partir
+        # do tamanho máximo, supondo sentenças de ~40 caracteres)
+        k = max(4, self.tamanho_maximo // 40)
+        melhores = heapq.nlargest(k, range(len(sentencas)), key=lambda i: pontuacoes[i])
         
         # Seleciona as sentenças mais importantes até atingir o tamanho máximo
-        resumo = ""
-        for sentenca in sentencas_ordenadas:
-            if len(resumo) + len(sentenca) + 1 <= self.tamanho_maximo:
-                resumo += sentenca + " "
+        selecionadas = []
+        tamanho = 0
+        for i in melhores:
+            if tamanho + len(sentencas[i]) + 1 <= self.tamanho_maximo:
+                selecionadas.append(i)
+                tamanho += len(sentencas[i]) + 1
             else:
                 break
         
-        # Se não conseguiu incluir nenhuma sentença completa, trunca a primeira
-        if not resumo:
-            resumo = self._truncar_texto(sentencas_ordenadas[0])
+        # Se não conseguiu incluir nenhuma sentença completa, trunca a melhor
+        if not selecionadas:
+            return self._truncar_texto(sentencas[melhores[0]])
+        
+        # Mantém a ordem de leitura original das sentenças selecionadas
+        resumo = " ".join(sentencas[i] for i in sorted(selecionadas))
         
         return resumo.strip()
     
@@ -160,34 +228,36 @@ class GeradorResumo:
             str: Texto pré-processado
         """
         # Remove quebras de linha e espaços extras
-        texto = re.sub(r'\s+', ' ', texto)
+        texto = _RE_WS.sub(' ', texto)
         texto = texto.strip()
         
         return texto
     
-    def _pontuar_sentencas(self, sentencas):
+    def _pontuar_sentencas(self, sentencas, palavras_por_sentenca=None):
         """
         Calcula a pontuação de cada sentença com base na frequência de palavras.
         
         Args:
             sentencas (list): Lista de sentenças
+            palavras_por_sentenca (list): Palavras relevantes de cada sentença;
+                se None, as sentenças são tokenizadas
             
         Returns:
             list: Lista de pontuações para cada sentença
         """
-        # Tokeniza todas as palavras do texto
-        palavras = []
-        for sentenca in sentencas:
-            palavras.extend(self._tokenizar_palavras(sentenca))
+        # Tokeniza cada sentença uma única vez
+        if palavras_por_sentenca is None:
+            palavras_por_sentenca = [self._tokenizar_palavras(sentenca) for sentenca in sentencas]
+        
+        if np is not None:
+            return self._pontuar_sentencas_vetorizado(palavras_por_sentenca)
         
         # Calcula a frequência de cada palavra
-        freq_palavras = FreqDist(palavras)
+        freq_palavras = Counter(palavra for palavras in palavras_por_sentenca for palavra in palavras)
         
         # Calcula a pontuação de cada sentença
         pontuacoes = []
-        for sentenca in sentencas:
-            palavras_sentenca = self._tokenizar_palavras(sentenca)
-            
+        for idx, palavras_sentenca in enumerate(palavras_por_sentenca):
             # Evita divisão por zero
             if not palavras_sentenca:
                 pontuacoes.append(0)
@@ -197,13 +267,51 @@ class GeradorResumo:
             pontuacao = sum(freq_palavras[palavra] for palavra in palavras_sentenca) / len(palavras_sentenca)
             
             # Bônus para sentenças no início do texto (primeiras 3 sentenças)
-            if sentencas.index(sentenca) < 3:
+            if idx < 3:
                 pontuacao *= 1.2
             
             pontuacoes.append(pontuacao)
         
         return pontuacoes
     
+    def _pontuar_sentencas_vetorizado(self, palavras_por_sentenca):
+        """
+        Calcula a pontuação das sentenças com operações vetoriais do NumPy.
+        
+        Equivale ao cálculo de `_pontuar_sentencas`: cada palavra recebe um
+        índice, as frequências saem de um `bincount` sobre todos os índices e
+        a soma por sentença de um `bincount` ponderado.
+        
+        Args:
+            palavras_por_sentenca (list): Palavras relevantes de cada sentença
+            
+        Returns:
+            list: Lista de pontuações para cada sentença
+        """
+        total_sentencas = len(palavras_por_sentenca)
+        
+        indices_palavras = {}
+        ids = [indices_palavras.setdefault(palavra, len(indices_palavras))
+               for palavras in palavras_por_sentenca for palavra in palavras]
+        if not ids:
+            return [0] * total_sentencas
+        
+        ids = np.array(ids, dtype=np.intp)
+        tamanhos = np.array([len(palavras) for palavras in palavras_por_sentenca], dtype=np.intp)
+        sentenca_de_cada_palavra = np.repeat(np.arange(total_sentencas), tamanhos)
+        
+        # Frequência de cada palavra e soma das frequências por sentença
+        freq_palavras = np.bincount(ids)
+        somas = np.bincount(sentenca_de_cada_palavra, weights=freq_palavras[ids], minlength=total_sentencas)
+        
+        # Média por sentença (sentenças sem palavras ficam com zero)
+        pontuacoes = np.divide(somas, tamanhos, out=np.zeros(total_sentencas), where=tamanhos > 0)
+        
+        # Bônus para sentenças no início do texto (primeiras 3 sentenças)
+        pontuacoes[:3] *= 1.2
+        
+        return pontuacoes.tolist()
+    
     def _tokenizar_palavras(self, texto):
         """
         Tokeniza um texto em palavras, removendo stopwords.
@@ -216,7 +324,7 @@ class GeradorResumo:
         """
         # Converte para minúsculas e remove pontuação
         texto = texto.lower()
-        texto = re.sub(r'[^\w\s]', '', texto)
+        texto = _RE_PUNCT.sub('', texto)
         
         # Tokeniza em palavras
         palavras = texto.split()
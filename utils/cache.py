@@ -1,8 +1,9 @@
 """
-Módulo de cache para o Agente Coletor.
+Módulo de cache em disco compartilhado pelos agentes do DOU.
 
 Este módulo implementa um sistema de cache para armazenar temporariamente
-o conteúdo extraído do DOU, evitando requisições repetidas.
+o conteúdo extraído do DOU (Agente Coletor) e as análises de publicações
+(Agente Processador), evitando requisições e processamentos repetidos.
 """
 
 import os
@@ -14,14 +15,14 @@ from datetime import datetime, timedelta
 from utils.logger import setup_logger
 
 # Configuração do logger
-logger = setup_logger('coletor.cache')
+logger = setup_logger('utils.cache')
 
 class Cache:
     """
-    Implementa um sistema de cache para armazenar conteúdo extraído do DOU.
+    Implementa um sistema de cache para armazenar conteúdo dos agentes do DOU.
     
     O cache armazena o conteúdo em arquivos no sistema de arquivos,
-    organizados por hash da URL.
+    organizados por hash da URL (ou de outra chave textual).
     """
     
     def __init__(self, cache_dir, validade_cache=timedelta(days=7)):
@@ -5,15 +5,45 @@ Este módulo implementa a classe Config para gerenciar as configurações
 globais do sistema de agentes.
 """
 
+import functools
+import io
 import os
 import json
+import logging
 from pathlib import Path
+from types import MappingProxyType
 
 from utils.logger import setup_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Configuração do logger
 logger = setup_logger('utils.config')
 
+# Diretório raiz do projeto, base dos caminhos padrão
+_BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Prefixo dos atributos em que cada configuração é memorizada
+_PREFIXO_MEMO = '_c_'
+
+# Diretórios já criados/verificados neste processo
+_MKDIR_CACHE = set()
+
+# Configurações lidas a cada requisição pelos agentes (tempo limite, tentativas,
+# intervalos), memorizadas em slots e com desvio direto no get especializado
+_CHAVES_FREQUENTES = ('timeout', 'max_retries', 'delay_entre_requisicoes', 'usar_cache')
+
+# Sentinela para distinguir configurações ausentes de valores None
+_AUSENTE = object()
+
 class Config:
     """
     Classe para gerenciar configurações do sistema de agentes.
@@ -22,11 +52,11 @@ class Config:
     métodos para acessar essas configurações.
     """
     
-    # Configurações padrão
-    DEFAULT_CONFIG = {
+    # Configurações padrão (somente leitura; compartilhadas até a primeira alteração)
+    DEFAULT_CONFIG = MappingProxyType({
         # Diretórios
-        'dados_dir': os.path.join(os.path.dirname(os.path.dirname(__file__)), 'dados'),
-        'cache_dir': os.path.join(os.path.dirname(os.path.dirname(__file__)), 'dados', 'cache'),
+        'dados_dir': os.path.join(_BASE, 'dados'),
+        'cache_dir': os.path.join(_BASE, 'dados', 'cache'),
         
         # Configurações do Agente Coletor
         'usar_cache': True,
@@ -40,6 +70,7 @@ class Config:
         'modelo_spacy': 'pt_core_news_lg',
         'tamanho_maximo_resumo': 200,
         'limiar_similaridade': 0.7,
+        'usar_cache_processador': False,
         
         # Configurações do Agente Organizador
         'formato_saida': 'csv',
@@ -59,8 +90,18 @@ class Config:
         
         # Configurações de logging
         'nivel_log': 'INFO',
-        'arquivo_log': os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs', 'agentes_dou.log'),
-    }
+        'arquivo_log': os.path.join(_BASE, 'logs', 'agentes_dou.log'),
+    })
+    
+    # Configurações opcionais, sem valor padrão (lidas com `get(chave, padrao)`)
+    CHAVES_OPCIONAIS = ('elasticsearch_index', 'max_paginas', 'selenium_timeout')
+    
+    # Chaves reconhecidas em arquivos de configuração
+    _VALID_KEYS = frozenset(DEFAULT_CONFIG).union(CHAVES_OPCIONAIS)
+    
+    # As configurações frequentes são memorizadas em slots próprios (lidos
+    # por `get`); as demais ficam apenas em `config`
+    __slots__ = ('config',) + tuple(_PREFIXO_MEMO + chave for chave in _CHAVES_FREQUENTES)
     
     def __init__(self, config_file=None):
         """
@@ -69,7 +110,9 @@ class Config:
         Args:
             config_file (str): Caminho para o arquivo de configuração JSON
         """
-        self.config = self.DEFAULT_CONFIG.copy()
+        # Compartilha os padrões (somente leitura) até a primeira alteração
+        self.config = self.DEFAULT_CONFIG
+        self._memorizar()
         
         if config_file:
             self.carregar_arquivo(config_file)
@@ -88,19 +131,47 @@ class Config:
             bool: True se o carregamento foi bem-sucedido, False caso contrário
         """
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config_usuario = json.load(f)
+            if orjson is not None:
+                config_usuario = orjson.loads(Path(config_file).read_bytes())
+            else:
+                with open(config_file, 'r', encoding='utf-8') as f:
+                    config_usuario = json.load(f)
+            
+            # Avisa sobre chaves não reconhecidas (provavelmente erros de digitação)
+            desconhecidas = config_usuario.keys() - self._VALID_KEYS
+            if desconhecidas:
+                logger.warning("Configurações desconhecidas em %s: %s", config_file, ', '.join(sorted(desconhecidas)))
             
             # Atualiza as configurações padrão com as do usuário
-            self.config.update(config_usuario)
-            logger.info(f"Configurações carregadas de {config_file}")
+            if config_usuario:
+                self._config_mutavel().update(config_usuario)
+                self._memorizar()
+            logger.info("Configurações carregadas de %s", config_file)
             return True
         
         except Exception as e:
-            logger.warning(f"Erro ao carregar configurações de {config_file}: {str(e)}")
+            logger.warning("Erro ao carregar configurações de %s: %s", config_file, e)
             logger.info("Usando configurações padrão")
             return False
     
+    def __getitem__(self, chave):
+        """
+        Retorna o valor de uma configuração, como em um dicionário.
+        
+        Args:
+            chave (str): Nome da configuração
+            
+        Returns:
+            Valor da configuração
+            
+        Raises:
+            KeyError: Se a configuração não existir
+        """
+        valor = self.get(chave, _AUSENTE)
+        if valor is _AUSENTE:
+            raise KeyError(chave)
+        return valor
+    
     def get(self, chave, padrao=None):
         """
         Retorna o valor de uma configuração.
@@ -122,7 +193,25 @@ class Config:
             chave (str): Nome da configuração
             valor: Novo valor para a configuração
         """
-        self.config[chave] = valor
+        self._config_mutavel()[chave] = valor
+        if chave in _CHAVES_FREQUENTES:
+            setattr(self, _PREFIXO_MEMO + chave, valor)
+    
+    def _config_mutavel(self):
+        """
+        Retorna o dicionário de configurações, copiando os padrões na primeira alteração.
+        
+        Returns:
+            dict: Configurações da instância, que podem ser alteradas
+        """
+        if isinstance(self.config, MappingProxyType):
+            self.config = dict(self.config)
+        return self.config
+    
+    def _memorizar(self):
+        """Copia as configurações frequentes para os slots da instância, lidos diretamente por `get`."""
+        for chave in _CHAVES_FREQUENTES:
+            setattr(self, _PREFIXO_MEMO + chave, self.config[chave])
     
     def salvar(self, arquivo):
         """
@@ -135,13 +224,18 @@ class Config:
             bool: True se o salvamento foi bem-sucedido, False caso contrário
         """
         try:
-            with open(arquivo, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
-            logger.info(f"Configurações salvas em {arquivo}")
+            if orjson is not None:
+                Path(arquivo).write_bytes(
+                    orjson.dumps(dict(self.config), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                )
+            else:
+                with open(arquivo, 'w', encoding='utf-8') as f:
+                    json.dump(dict(self.config), f, indent=2, ensure_ascii=False)
+            logger.info("Configurações salvas em %s", arquivo)
             return True
         
         except Exception as e:
-            logger.error(f"Erro ao salvar configurações em {arquivo}: {str(e)}")
+            logger.error("Erro ao salvar configurações em %s: %s", arquivo, e)
             return False
     
     def _criar_diretorios(self):
@@ -155,9 +249,197 @@ class Config:
             os.path.dirname(self.get('arquivo_log'))
         ]
         
-        for diretorio in diretorios:
+        # Normaliza os caminhos e elimina duplicatas (caminhos vazios, como o do
+        # log no diretório atual, são ignorados), ordenando por profundidade
+        unicos = sorted({os.path.abspath(d) for d in diretorios if d}, key=lambda d: (d.count(os.sep), d))
+        
+        # O makedirs cria os intermediários: basta criar as folhas, isto é, os
+        # caminhos que não são ancestrais de outro caminho da lista
+        folhas = [d for d in unicos if not any(outro.startswith(d + os.sep) for outro in unicos)]
+        
+        for diretorio in folhas:
+            if diretorio in _MKDIR_CACHE:
+                continue
+            
             try:
-                Path(diretorio).mkdir(parents=True, exist_ok=True)
-                logger.debug(f"Diretório criado/verificado: {diretorio}")
+                if not os.path.isdir(diretorio):
+                    os.makedirs(diretorio, exist_ok=True)
+                _MKDIR_CACHE.add(diretorio)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Diretório criado/verificado: %s", diretorio)
             except Exception as e:
-                logger.warning(f"Erro ao criar diretório {diretorio}: {str(e)}")
+                logger.warning("Erro ao criar diretório %s: %s", diretorio, e)
+
+def _gerar_get(chaves):
+    """
+    Gera um método `get` especializado para um conjunto fixo de chaves.
+    
+    O código gerado compara a chave com cada uma das chaves informadas e lê
+    diretamente o slot correspondente; as demais são buscadas no dicionário
+    de configurações. Como as comparações são feitas em sequência, convém
+    informar apenas poucas chaves, as mais consultadas.
+    
+    Args:
+        chaves (iterable): Nomes de configurações memorizadas em slots
+        
+    Returns:
+        function: Função `get(self, chave, padrao=None)`
+    """
+    linhas = ['def get(self, chave, padrao=None):']
+    linhas += [f'    if chave == {chave!r}: return self.{_PREFIXO_MEMO}{chave}' for chave in chaves]
+    linhas.append('    return self.config.get(chave, padrao)')
+    
+    namespace = {}
+    exec(compile('\n'.join(linhas), '<Config.get gerado>', 'exec'), namespace)
+    return namespace['get']
+
+# O formato de DEFAULT_CONFIG é fixo: substitui o get genérico por um especializado
+Config.get = functools.update_wrapper(_gerar_get(_CHAVES_FREQUENTES), Config.get)
+
+class LazyConfig(Config):
+    """
+    Configuração com extração sob demanda das chaves do arquivo JSON.
+    
+    O arquivo é lido uma única vez como bytes, mas cada chave só é extraída
+    (com o ijson) no primeiro acesso via `get`, e o valor é então guardado em
+    `self.config`. As chaves nunca consultadas não chegam a ser construídas.
+    Sem o ijson, o arquivo é carregado inteiro, como em Config.
+    """
+    
+    __slots__ = ('_bruto', '_extraidas')
+    
+    def __init__(self, config_file=None):
+        """
+        Inicializa o objeto de configuração.
+        
+        Args:
+            config_file (str): Caminho para o arquivo de configuração JSON
+        """
+        self._bruto = None
+        self._extraidas = set()
+        super().__init__(config_file)
+    
+    def carregar_arquivo(self, config_file):
+        """
+        Lê o arquivo de configuração, adiando a extração das chaves.
+        
+        Args:
+            config_file (str): Caminho para o arquivo de configuração
+            
+        Returns:
+            bool: True se a leitura foi bem-sucedida, False caso contrário
+        """
+        if ijson is None:
+            return super().carregar_arquivo(config_file)
+        
+        try:
+            bruto = Path(config_file).read_bytes()
+            
+            # Percorre os eventos uma vez, sem construir valores, para rejeitar
+            # JSON malformado já na leitura e conhecer as chaves do arquivo
+            chaves = set()
+            eventos = ijson.parse(io.BytesIO(bruto))
+            _, evento, _ = next(eventos)
+            if evento != 'start_map':
+                raise ValueError("o arquivo de configuração deve conter um objeto JSON")
+            for prefixo, evento, valor in eventos:
+                if evento == 'map_key' and prefixo == '':
+                    chaves.add(valor)
+            
+            desconhecidas = chaves - self._VALID_KEYS
+            if desconhecidas:
+                logger.warning("Configurações desconhecidas em %s: %s", config_file, ', '.join(sorted(desconhecidas)))
+            
+            self._materializar()
+            self._bruto = bruto
+            self._extraidas.clear()
+            logger.info("Configurações carregadas de %s", config_file)
+            return True
+        
+        except Exception as e:
+            logger.warning("Erro ao carregar configurações de %s: %s", config_file, e)
+            logger.info("Usando configurações padrão")
+            return False
+    
+    def get(self, chave, padrao=None):
+        """
+        Retorna o valor de uma configuração, extraindo-a do arquivo no primeiro acesso.
+        
+        Args:
+            chave (str): Nome da configuração
+            padrao: Valor padrão caso a configuração não exista
+            
+        Returns:
+            Valor da configuração ou o valor padrão
+        """
+        if self._bruto is not None and chave not in self._extraidas:
+            self._extraidas.add(chave)
+            try:
+                for valor in ijson.items(io.BytesIO(self._bruto), chave, use_float=True):
+                    super().set(chave, valor)
+                    break
+            except Exception as e:
+                logger.warning("Erro ao extrair a configuração '%s': %s", chave, e)
+        
+        return super().get(chave, padrao)
+    
+    def set(self, chave, valor):
+        """
+        Define o valor de uma configuração.
+        
+        Args:
+            chave (str): Nome da configuração
+            valor: Novo valor para a configuração
+        """
+        # O valor definido prevalece sobre o do arquivo, mesmo que ainda não extraído
+        self._extraidas.add(chave)
+        super().set(chave, valor)
+    
+    def salvar(self, arquivo):
+        """
+        Salva as configurações em um arquivo JSON.
+        
+        Args:
+            arquivo (str): Caminho para o arquivo de saída
+            
+        Returns:
+            bool: True se o salvamento foi bem-sucedido, False caso contrário
+        """
+        self._materializar()
+        return super().salvar(arquivo)
+    
+    def _materializar(self):
+        """Extrai de uma vez todas as chaves do arquivo ainda não acessadas."""
+        if self._bruto is None:
+            return
+        
+        config_usuario = orjson.loads(self._bruto) if orjson is not None else json.loads(self._bruto)
+        for chave, valor in config_usuario.items():
+            if chave not in self._extraidas:
+                self._config_mutavel()[chave] = valor
+        self._memorizar()
+        
+        self._bruto = None
+        self._extraidas.clear()
+
+# Instâncias compartilhadas de Config, por arquivo de configuração
+_INSTANCES = {}
+
+def get_config(config_file=None):
+    """
+    Retorna a instância compartilhada de Config para um arquivo de configuração.
+    
+    Deve ser preferida a `Config(...)` nos agentes: o arquivo é lido e os
+    diretórios são verificados apenas uma vez por processo. Alterações feitas
+    com `set` são vistas por todos que usam a mesma instância.
+    
+    Args:
+        config_file (str): Caminho para o arquivo de configuração JSON
+        
+    Returns:
+        Config: Instância de configuração
+    """
+    config = _INSTANCES.get(config_file)
+    if config is None:
+        config = _INSTANCES.setdefault(config_file, Config(config_file))
+    return config
@@ -5,14 +5,281 @@ Este módulo implementa funções para configurar e utilizar
 o sistema de logging em todos os agentes.
 """
 
+import atexit
 import os
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+class _FiltroEnfileiramentoUnico(logging.Filter):
+    """
+    Deixa cada registro passar pelo QueueHandler compartilhado uma única vez.
+    
+    O mesmo handler é anexado a todos os loggers configurados: sem este filtro,
+    um registro de 'processador.nlp' seria enfileirado de novo ao se propagar
+    para 'processador'. O roteamento para os arquivos de cada logger é feito
+    pelos filtros de nome dos handlers do listener.
+    """
+    
+    def filter(self, record):
+        """
+        Marca o registro como enfileirado, recusando-o se já estiver marcado.
+        
+        Args:
+            record (logging.LogRecord): Registro a ser enfileirado
+            
+        Returns:
+            bool: True apenas na primeira passagem do registro
+        """
+        if getattr(record, '_enfileirado', False):
+            return False
+        record._enfileirado = True
+        return True
+
+# Fila pela qual todos os loggers enviam seus registros; a escrita no console
+# e nos arquivos é feita por um QueueListener, em uma thread em segundo plano
+_LOG_QUEUE = queue.SimpleQueue()
+_QUEUE_HANDLER = QueueHandler(_LOG_QUEUE)
+_QUEUE_HANDLER.addFilter(_FiltroEnfileiramentoUnico())
+
+# Intervalo máximo (segundos) entre descargas dos buffers dos arquivos de log
+_INTERVALO_DESCARGA = 1.0
+
+# Listener da fila, iniciado na primeira chamada de setup_logger
+_listener = None
+_listener_lock = threading.Lock()
+
+# Loggers já configurados por setup_logger, por nome
+_LOGGER_CACHE = {}
+_logger_cache_lock = threading.Lock()
+
+# Formatador aplicado pelos handlers do listener
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler que grava em buffer, sem descarregar a cada registro.
+    
+    O arquivo é aberto com um buffer de `buffering` bytes, descarregado a cada
+    `flush_registros` registros, quando passam `flush_intervalo` segundos desde
+    a última descarga, quando a fila de logs fica ociosa, na rotação e no
+    fechamento. O tamanho do arquivo é acompanhado em memória, em vez do
+    seek/tell por registro (que descarregaria o buffer).
+    """
+    
+    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None,
+                 delay=False, errors=None, buffering=8192, flush_registros=100,
+                 flush_intervalo=_INTERVALO_DESCARGA):
+        """
+        Inicializa o handler (demais argumentos como em RotatingFileHandler).
+        
+        Args:
+            buffering (int): Tamanho do buffer de escrita em bytes
+            flush_registros (int): Número de registros entre descargas
+            flush_intervalo (float): Intervalo máximo em segundos entre descargas
+        """
+        self.buffering = buffering
+        self.flush_registros = flush_registros
+        self.flush_intervalo = flush_intervalo
+        self._tamanho = 0
+        self._arquivo_regular = True
+        self._pendentes = 0
+        self._ultima_descarga = time.monotonic()
+        super().__init__(filename, mode, maxBytes, backupCount, encoding, delay, errors)
+    
+    def _open(self):
+        """Abre o arquivo com buffer e registra seu tamanho atual."""
+        stream = open(self.baseFilename, self.mode, buffering=self.buffering,
+                      encoding=self.encoding, errors=self.errors)
+        stream.seek(0, 2)
+        self._tamanho = stream.tell()
+        
+        # Nunca rotaciona o que não for um arquivo comum (ver bpo-45401)
+        self._arquivo_regular = os.path.isfile(self.baseFilename)
+        return stream
+    
+    def shouldRollover(self, record):
+        """
+        Verifica se o registro faria o arquivo exceder o tamanho máximo.
+        
+        Args:
+            record (logging.LogRecord): Registro a ser gravado
+            
+        Returns:
+            bool: True se o arquivo deve ser rotacionado
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes > 0 and self._arquivo_regular:
+            msg = "%s\n" % self.format(record)
+            if self._tamanho + len(msg) >= self.maxBytes:
+                return True
+        return False
+    
+    def emit(self, record):
+        """
+        Grava o registro no buffer, rotacionando o arquivo se necessário.
+        
+        Args:
+            record (logging.LogRecord): Registro a ser gravado
+        """
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg)
+            self._tamanho += len(msg)
+            self._pendentes += 1
+            
+            if (self._pendentes >= self.flush_registros
+                    or time.monotonic() - self._ultima_descarga >= self.flush_intervalo):
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        """Descarrega o buffer no arquivo."""
+        super().flush()
+        self._pendentes = 0
+        self._ultima_descarga = time.monotonic()
+
+class _QueueListenerComDescarga(QueueListener):
+    """QueueListener que descarrega os handlers sempre que a fila fica ociosa."""
+    
+    def dequeue(self, block):
+        """
+        Retira um registro da fila, descarregando os handlers enquanto espera.
+        
+        Args:
+            block (bool): Se True, aguarda até haver um registro na fila
+            
+        Returns:
+            logging.LogRecord: Próximo registro da fila
+        """
+        if not block:
+            return self.queue.get(block=False)
+        
+        while True:
+            try:
+                return self.queue.get(timeout=_INTERVALO_DESCARGA)
+            except queue.Empty:
+                for handler in self.handlers:
+                    handler.flush()
+
+def _iniciar_listener(handlers):
+    """
+    Cria e inicia o QueueListener que consome a fila de logs.
+    
+    Args:
+        handlers (tuple): Handlers que recebem os registros da fila
+    """
+    global _listener
+    _listener = _QueueListenerComDescarga(_LOG_QUEUE, *handlers, respect_handler_level=True)
+    _listener.start()
+
+def _obter_listener():
+    """
+    Retorna o listener da fila de logs, iniciando-o se necessário.
+    
+    Returns:
+        logging.handlers.QueueListener: Listener em execução
+    """
+    with _listener_lock:
+        if _listener is None:
+            # Adiciona handler para console
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(_FORMATTER)
+            _iniciar_listener((console_handler,))
+        return _listener
+
+def _adicionar_handler(handler):
+    """
+    Adiciona um handler ao listener da fila de logs.
+    
+    Args:
+        handler (logging.Handler): Handler a ser adicionado
+    """
+    listener = _obter_listener()
+    with _listener_lock:
+        listener.handlers = listener.handlers + (handler,)
+
+@atexit.register
+def _parar_listener():
+    """Grava os registros pendentes na fila e encerra o listener."""
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+
+# Handlers descarregados e bloqueados durante um fork
+_handlers_bloqueados = ()
+
+def _descarregar_antes_do_fork():
+    """
+    Descarrega os buffers dos handlers antes de um fork e os mantém bloqueados.
+    
+    Sem isso, o filho herdaria os registros ainda em buffer e os gravaria de
+    novo no arquivo. Os locks impedem que o listener volte a escrever entre a
+    descarga e o fork.
+    """
+    global _handlers_bloqueados
+    if _listener is None:
+        return
+    
+    _handlers_bloqueados = _listener.handlers
+    for handler in _handlers_bloqueados:
+        handler.acquire()
+        try:
+            handler.flush()
+        except Exception:
+            pass
+
+def _liberar_apos_fork():
+    """Libera, no processo pai, os handlers bloqueados antes do fork."""
+    global _handlers_bloqueados
+    for handler in reversed(_handlers_bloqueados):
+        handler.release()
+    _handlers_bloqueados = ()
+
+def _reiniciar_listener_apos_fork():
+    """Reinicia o listener no processo filho, onde a thread do pai não existe."""
+    global _LOG_QUEUE, _listener_lock, _logger_cache_lock, _handlers_bloqueados
+    
+    # Os locks dos handlers já são recriados pelo módulo logging no filho
+    _handlers_bloqueados = ()
+    
+    # Os registros copiados da fila do pai continuam sendo gravados por ele
+    _LOG_QUEUE = queue.SimpleQueue()
+    _QUEUE_HANDLER.queue = _LOG_QUEUE
+    _listener_lock = threading.Lock()
+    _logger_cache_lock = threading.Lock()
+    if _listener is not None:
+        _iniciar_listener(_listener.handlers)
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(
+        before=_descarregar_antes_do_fork,
+        after_in_parent=_liberar_apos_fork,
+        after_in_child=_reiniciar_listener_apos_fork
+    )
 
 def setup_logger(nome, nivel=None, arquivo_log=None, max_bytes=10485760, backup_count=5):
     """
     Configura e retorna um logger.
     
+    O logger recebe apenas um QueueHandler: cada registro é colocado na fila
+    de logs e gravado no console (e no arquivo, se especificado) pela thread
+    do QueueListener, fora do caminho de execução dos agentes.
+    
     Args:
         nome (str): Nome do logger
         nivel (str): Nível de logging (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -20,6 +287,26 @@ def setup_logger(nome, nivel=None, arquivo_log=None, max_bytes=10485760, backup_
         max_bytes (int): Tamanho máximo do arquivo de log antes de rotacionar
         backup_count (int): Número de arquivos de backup a manter
         
+    Returns:
+        logging.Logger: Logger configurado
+    """
+    # Caminho rápido: logger já configurado (sem adquirir o lock)
+    logger = _LOGGER_CACHE.get(nome)
+    if logger is not None:
+        return logger
+    
+    with _logger_cache_lock:
+        logger = _LOGGER_CACHE.get(nome)
+        if logger is None:
+            logger = _configurar_logger(nome, nivel, arquivo_log, max_bytes, backup_count)
+            _LOGGER_CACHE[nome] = logger
+    
+    return logger
+
+def _configurar_logger(nome, nivel, arquivo_log, max_bytes, backup_count):
+    """
+    Configura um logger (parâmetros como em setup_logger).
+    
     Returns:
         logging.Logger: Logger configurado
     """
@@ -35,16 +322,9 @@ def setup_logger(nome, nivel=None, arquivo_log=None, max_bytes=10485760, backup_
     nivel_numerico = getattr(logging, nivel_log.upper(), logging.INFO)
     logger.setLevel(nivel_numerico)
     
-    # Cria o formatador
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    # Adiciona handler para console
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    # Garante que o listener (com o handler de console) esteja em execução
+    _obter_listener()
+    logger.addHandler(_QUEUE_HANDLER)
     
     # Adiciona handler para arquivo, se especificado
     if arquivo_log:
@@ -52,15 +332,17 @@ def setup_logger(nome, nivel=None, arquivo_log=None, max_bytes=10485760, backup_
             # Cria o diretório do arquivo de log, se necessário
             os.makedirs(os.path.dirname(arquivo_log), exist_ok=True)
             
-            # Configura o handler de arquivo com rotação
-            file_handler = RotatingFileHandler(
+            # Configura o handler de arquivo com rotação e escrita em buffer,
+            # restrito aos registros deste logger (e de seus filhos)
+            file_handler = BufferedRotatingFileHandler(
                 arquivo_log,
                 maxBytes=max_bytes,
                 backupCount=backup_count,
                 encoding='utf-8'
             )
-            file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            file_handler.setFormatter(_FORMATTER)
+            file_handler.addFilter(logging.Filter(nome))
+            _adicionar_handler(file_handler)
         except Exception as e:
             logger.warning(f"Não foi possível configurar o log em arquivo: {str(e)}")
     
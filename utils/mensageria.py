@@ -5,13 +5,66 @@ Este módulo implementa funções para comunicação assíncrona
 entre os diferentes agentes do sistema.
 """
 
+import atexit
+import functools
 import json
+import logging
+import threading
+import time
+from concurrent.futures import Future
 import pika
 from utils.logger import setup_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuração do logger
 logger = setup_logger('utils.mensageria')
 
+# Conexões (e respectivos canais) reutilizadas entre publicações, por (host, porta, usuário)
+_CONN_POOL = {}
+
+# Exchanges já declarados em cada conexão, por id da conexão
+_DECLARED = {}
+
+# A BlockingConnection não é thread-safe: o uso do pool é serializado por este lock
+_POOL_LOCK = threading.Lock()
+
+# Intervalo entre consultas à fila em consumir_mensagem_unica (segundos)
+_INTERVALO_POLLING = 0.1
+
+# Propriedades das mensagens publicadas (constantes)
+_PROPS = pika.BasicProperties(
+    delivery_mode=2,  # Mensagem persistente
+    content_type='application/json',
+    content_encoding='utf-8'
+)
+
+@functools.lru_cache(maxsize=32)
+def _build_params(host, porta, usuario, senha):
+    """
+    Monta (uma única vez por combinação de argumentos) os parâmetros de conexão.
+    
+    Args:
+        host (str): Host do servidor RabbitMQ
+        porta (int): Porta do servidor RabbitMQ
+        usuario (str): Nome de usuário para autenticação
+        senha (str): Senha para autenticação
+        
+    Returns:
+        pika.ConnectionParameters: Parâmetros de conexão
+    """
+    credentials = pika.PlainCredentials(usuario, senha)
+    return pika.ConnectionParameters(
+        host=host,
+        port=porta,
+        credentials=credentials,
+        heartbeat=600,
+        blocked_connection_timeout=300
+    )
+
 def conectar_rabbitmq(host='localhost', porta=5672, usuario='guest', senha='guest'):
     """
     Estabelece conexão com o servidor RabbitMQ.
@@ -26,19 +79,110 @@ def conectar_rabbitmq(host='localhost', porta=5672, usuario='guest', senha='gues
         pika.BlockingConnection: Conexão com o RabbitMQ
     """
     try:
-        credentials = pika.PlainCredentials(usuario, senha)
-        parameters = pika.ConnectionParameters(
-            host=host,
-            port=porta,
-            credentials=credentials,
-            heartbeat=600,
-            blocked_connection_timeout=300
-        )
-        return pika.BlockingConnection(parameters)
+        return pika.BlockingConnection(_build_params(host, porta, usuario, senha))
     except Exception as e:
-        logger.error(f"Erro ao conectar ao RabbitMQ: {str(e)}")
+        logger.error("Erro ao conectar ao RabbitMQ: %s", e)
         raise
 
+def _serializar(mensagem):
+    """
+    Serializa uma mensagem em JSON (UTF-8), com orjson quando disponível.
+    
+    Args:
+        mensagem (dict): Mensagem a ser serializada
+        
+    Returns:
+        bytes: Corpo da mensagem
+    """
+    if orjson is not None:
+        return orjson.dumps(mensagem)
+    return json.dumps(mensagem, ensure_ascii=False).encode('utf-8')
+
+def _desserializar(body):
+    """
+    Desserializa o corpo JSON de uma mensagem, com orjson quando disponível.
+    
+    O corpo é lido diretamente dos bytes recebidos, sem decodificá-lo antes
+    em uma str (o json da biblioteca padrão também aceita bytes UTF-8).
+    
+    Args:
+        body (bytes): Corpo da mensagem
+        
+    Returns:
+        dict: Mensagem
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+def _get_channel(host, porta, usuario, senha):
+    """
+    Retorna o canal de publicação de uma conexão do pool, criando a conexão se necessário.
+    
+    O canal é transacional (`tx_select`): as publicações só são entregues no
+    `tx_commit`. Deve ser chamada com `_POOL_LOCK` adquirido.
+    
+    Args:
+        host (str): Host do servidor RabbitMQ
+        porta (int): Porta do servidor RabbitMQ
+        usuario (str): Nome de usuário para autenticação
+        senha (str): Senha para autenticação
+        
+    Returns:
+        pika.adapters.blocking_connection.BlockingChannel: Canal aberto
+    """
+    chave = (host, porta, usuario)
+    conexao, canal = _CONN_POOL.get(chave, (None, None))
+    
+    if conexao is None or conexao.is_closed or canal.is_closed:
+        _descartar_conexao(chave)
+        conexao = conectar_rabbitmq(host, porta, usuario, senha)
+        canal = conexao.channel()
+        canal.tx_select()
+        _CONN_POOL[chave] = (conexao, canal)
+    
+    return canal
+
+def _descartar_conexao(chave):
+    """
+    Remove uma conexão do pool, fechando-a se ainda estiver aberta.
+    
+    Deve ser chamada com `_POOL_LOCK` adquirido.
+    
+    Args:
+        chave (tuple): Chave da conexão no pool (host, porta, usuário)
+    """
+    conexao, _ = _CONN_POOL.pop(chave, (None, None))
+    if conexao is not None:
+        _DECLARED.pop(id(conexao), None)
+    
+    if conexao is not None and conexao.is_open:
+        try:
+            conexao.close()
+        except Exception as e:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Erro ao fechar conexão com o RabbitMQ: %s", e)
+
+def _ensure_exchange(channel, topico):
+    """
+    Declara o exchange (fanout, durável) de um tópico, se ainda não declarado na conexão do canal.
+    
+    Args:
+        channel (pika.adapters.blocking_connection.BlockingChannel): Canal aberto
+        topico (str): Nome do tópico (exchange)
+    """
+    declarados = _DECLARED.setdefault(id(channel.connection), set())
+    if topico not in declarados:
+        channel.exchange_declare(exchange=topico, exchange_type='fanout', durable=True)
+        declarados.add(topico)
+
+@atexit.register
+def _fechar_conexoes():
+    """Fecha as conexões do pool ao encerrar o processo."""
+    with _POOL_LOCK:
+        for chave in list(_CONN_POOL):
+            _descartar_conexao(chave)
+
 def publicar_mensagem(topico, mensagem, host='localhost', porta=5672, usuario='guest', senha='guest'):
     """
     Publica uma mensagem em um tópico específico.
@@ -54,38 +198,317 @@ def publicar_mensagem(topico, mensagem, host='localhost', porta=5672, usuario='g
     Returns:
         bool: True se a mensagem foi publicada com sucesso, False caso contrário
     """
+    return publicar_lote(topico, [mensagem], host, porta, usuario, senha)
+
+def publicar_lote(topico, mensagens, host='localhost', porta=5672, usuario='guest', senha='guest'):
+    """
+    Publica um lote de mensagens em um tópico específico.
+    
+    Todas as mensagens são enviadas pelo mesmo canal e confirmadas por um
+    único `tx_commit`: ou o lote inteiro é entregue, ou nenhuma mensagem é.
+    
+    Args:
+        topico (str): Nome do tópico (exchange)
+        mensagens (iterable): Mensagens (dicts) a serem publicadas
+        host (str): Host do servidor RabbitMQ
+        porta (int): Porta do servidor RabbitMQ
+        usuario (str): Nome de usuário para autenticação
+        senha (str): Senha para autenticação
+        
+    Returns:
+        bool: True se o lote foi publicado com sucesso, False caso contrário
+    """
     try:
-        # Estabelece conexão
-        connection = conectar_rabbitmq(host, porta, usuario, senha)
-        channel = connection.channel()
+        # Converte as mensagens para JSON
+        bodies = [_serializar(mensagem) for mensagem in mensagens]
+    except Exception as e:
+        logger.error("Erro ao serializar mensagem para o tópico '%s': %s", topico, e)
+        return False
+    
+    if not bodies:
+        return True
+    
+    chave = (host, porta, usuario)
+    
+    # A conexão do pool pode ter sido fechada pelo servidor enquanto ociosa;
+    # nesse caso, é descartada e o lote é repetido uma vez com uma nova
+    for tentativa in range(2):
+        try:
+            with _POOL_LOCK:
+                # Obtém o canal da conexão reutilizada
+                channel = _get_channel(host, porta, usuario, senha)
+                
+                # Declara o exchange (apenas na primeira vez nesta conexão)
+                _ensure_exchange(channel, topico)
+                
+                # Publica as mensagens e confirma o lote de uma só vez
+                for body in bodies:
+                    channel.basic_publish(
+                        exchange=topico,
+                        routing_key='',
+                        body=body,
+                        properties=_PROPS
+                    )
+                channel.tx_commit()
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s mensagem(ns) publicada(s) no tópico '%s'", len(bodies), topico)
+            return True
         
-        # Declara o exchange
-        channel.exchange_declare(exchange=topico, exchange_type='fanout', durable=True)
+        except Exception as e:
+            # Descartar a conexão também descarta as publicações não confirmadas
+            with _POOL_LOCK:
+                _descartar_conexao(chave)
+            
+            if tentativa == 0:
+                logger.warning("Falha ao publicar no tópico '%s' (%s). Reconectando...", topico, e)
+            else:
+                logger.error("Erro ao publicar mensagens no tópico '%s': %s", topico, e)
+    
+    return False
+
+class AsyncPublisher:
+    """
+    Publicador assíncrono com confirmações do broker (publisher confirms).
+    
+    Mantém uma `pika.SelectConnection` com o IOLoop em uma thread própria.
+    As publicações são enviadas sem esperar a confirmação das anteriores e
+    cada uma retorna um Future, resolvido quando o broker confirma (Basic.Ack)
+    ou rejeita (Basic.Nack) a mensagem. O número de mensagens em trânsito é
+    limitado por `max_pendentes`: acima dele, `publish` aguarda confirmações.
+    
+    Uso:
+        with AsyncPublisher(host, porta) as publisher:
+            publisher.publish('coleta_concluida', mensagem).result(timeout=5)
+    """
+    
+    def __init__(self, host='localhost', porta=5672, usuario='guest', senha='guest', max_pendentes=1000):
+        """
+        Inicializa o publicador (a conexão é aberta por `iniciar`).
+        
+        Args:
+            host (str): Host do servidor RabbitMQ
+            porta (int): Porta do servidor RabbitMQ
+            usuario (str): Nome de usuário para autenticação
+            senha (str): Senha para autenticação
+            max_pendentes (int): Número máximo de mensagens aguardando confirmação
+        """
+        self.parametros = _build_params(host, porta, usuario, senha)
+        self._janela = threading.BoundedSemaphore(max_pendentes)
+        self._em_transito = 0
+        self._transito_cond = threading.Condition()
+        self._pendentes = {}
+        self._proxima_tag = 1
+        self._declarados = set()
+        self._pronto = threading.Event()
+        self._erro = None
+        self._connection = None
+        self._channel = None
+        self._thread = None
+    
+    def __enter__(self):
+        """Abre a conexão ao entrar no bloco `with`."""
+        return self.iniciar()
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Fecha a conexão ao sair do bloco `with`."""
+        self.fechar()
+        return False
+    
+    def iniciar(self, timeout=10):
+        """
+        Abre a conexão e inicia o IOLoop em segundo plano.
+        
+        Args:
+            timeout (float): Tempo máximo de espera pela abertura do canal
+            
+        Returns:
+            AsyncPublisher: O próprio publicador
+            
+        Raises:
+            ConnectionError: Se não for possível abrir a conexão a tempo
+        """
+        self._connection = pika.SelectConnection(
+            self.parametros,
+            on_open_callback=self._on_connection_open,
+            on_open_error_callback=self._on_connection_open_error,
+            on_close_callback=self._on_connection_closed
+        )
+        self._thread = threading.Thread(
+            target=self._connection.ioloop.start, name='AsyncPublisher', daemon=True
+        )
+        self._thread.start()
+        
+        if not self._pronto.wait(timeout) or self._erro is not None:
+            self.fechar()
+            raise ConnectionError(f"Não foi possível conectar ao RabbitMQ: {self._erro or 'tempo esgotado'}")
+        
+        logger.info("Publicador assíncrono conectado ao RabbitMQ")
+        return self
+    
+    def publish(self, topico, mensagem):
+        """
+        Publica uma mensagem sem aguardar a confirmação do broker.
         
-        # Converte a mensagem para JSON
-        mensagem_json = json.dumps(mensagem, ensure_ascii=False)
-        
-        # Publica a mensagem
-        channel.basic_publish(
-            exchange=topico,
-            routing_key='',
-            body=mensagem_json.encode('utf-8'),
-            properties=pika.BasicProperties(
-                delivery_mode=2,  # Mensagem persistente
-                content_type='application/json',
-                content_encoding='utf-8'
-            )
+        Args:
+            topico (str): Nome do tópico (exchange)
+            mensagem (dict): Mensagem a ser publicada
+            
+        Returns:
+            concurrent.futures.Future: Resolvido com True quando o broker
+                confirma a mensagem, ou com exceção se ela for rejeitada ou
+                a conexão for perdida
+        """
+        future = Future()
+        body = _serializar(mensagem)
+        
+        # Limita o número de mensagens em trânsito (aguarda confirmações)
+        self._janela.acquire()
+        with self._transito_cond:
+            self._em_transito += 1
+        
+        if self._thread is None or not self._thread.is_alive():
+            self._liberar_janela()
+            future.set_exception(ConnectionError("Publicador assíncrono não está conectado"))
+            return future
+        
+        self._connection.ioloop.add_callback_threadsafe(
+            functools.partial(self._publicar, topico, body, future)
         )
+        return future
+    
+    def fechar(self, timeout=10):
+        """
+        Aguarda as confirmações pendentes, fecha a conexão e aguarda o término do IOLoop.
         
-        # Fecha a conexão
-        connection.close()
+        Args:
+            timeout (float): Tempo máximo de espera pelas confirmações e,
+                depois, pelo término do IOLoop
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return
         
-        logger.debug(f"Mensagem publicada no tópico '{topico}'")
-        return True
+        # Mensagens ainda sem confirmação provavelmente já chegaram ao broker:
+        # fechar antes resolveria seus Futures com erro
+        with self._transito_cond:
+            if not self._transito_cond.wait_for(lambda: self._em_transito == 0, timeout):
+                logger.warning(
+                    "Fechando o publicador assíncrono com %d mensagens sem confirmação",
+                    self._em_transito
+                )
+        
+        self._connection.ioloop.add_callback_threadsafe(self._fechar_conexao)
+        self._thread.join(timeout)
     
-    except Exception as e:
-        logger.error(f"Erro ao publicar mensagem no tópico '{topico}': {str(e)}")
-        return False
+    def _publicar(self, topico, body, future):
+        """Publica a mensagem no canal (executado na thread do IOLoop)."""
+        if self._channel is None or not self._channel.is_open:
+            self._liberar_janela()
+            future.set_exception(ConnectionError("Canal do publicador assíncrono fechado"))
+            return
+        
+        # A declaração é processada pelo broker antes da publicação seguinte no canal
+        if topico not in self._declarados:
+            self._channel.exchange_declare(exchange=topico, exchange_type='fanout', durable=True)
+            self._declarados.add(topico)
+        
+        self._channel.basic_publish(exchange=topico, routing_key='', body=body, properties=_PROPS)
+        
+        # Com confirmações ativas, o broker numera as publicações do canal a partir de 1
+        self._pendentes[self._proxima_tag] = future
+        self._proxima_tag += 1
+    
+    def _fechar_conexao(self):
+        """Fecha a conexão (executado na thread do IOLoop)."""
+        if self._connection.is_open:
+            # O IOLoop é encerrado em _on_connection_closed
+            self._connection.close()
+            return
+        
+        # Conexão ainda em abertura (tempo esgotado em `iniciar`): interrompe a
+        # abertura e encerra o IOLoop, para que a thread termine
+        if not self._connection.is_closed and not self._connection.is_closing:
+            try:
+                self._connection.close()
+            except Exception as e:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Erro ao interromper a abertura da conexão: %s", e)
+        self._connection.ioloop.stop()
+    
+    def _on_connection_open(self, connection):
+        """Abre o canal assim que a conexão é estabelecida."""
+        connection.channel(on_open_callback=self._on_channel_open)
+    
+    def _on_connection_open_error(self, connection, erro):
+        """Registra a falha de conexão e encerra o IOLoop."""
+        self._erro = erro
+        self._pronto.set()
+        connection.ioloop.stop()
+    
+    def _on_connection_closed(self, connection, motivo):
+        """Falha as publicações pendentes e encerra o IOLoop."""
+        self._channel = None
+        if not self._pronto.is_set():
+            # Fechada antes de o canal ficar pronto: libera quem aguarda em `iniciar`
+            self._erro = motivo
+            self._pronto.set()
+        self._falhar_pendentes(motivo)
+        connection.ioloop.stop()
+    
+    def _on_channel_open(self, channel):
+        """Ativa as confirmações de publicação no canal recém-aberto."""
+        self._channel = channel
+        channel.add_on_close_callback(self._on_channel_closed)
+        channel.confirm_delivery(
+            ack_nack_callback=self._on_confirmacao,
+            callback=lambda _frame: self._pronto.set()
+        )
+    
+    def _on_channel_closed(self, channel, motivo):
+        """Falha as publicações pendentes e fecha a conexão."""
+        logger.warning("Canal do publicador assíncrono fechado: %s", motivo)
+        self._channel = None
+        self._falhar_pendentes(motivo)
+        if self._connection.is_open:
+            self._connection.close()
+    
+    def _on_confirmacao(self, frame):
+        """Resolve os Futures das mensagens confirmadas ou rejeitadas pelo broker."""
+        metodo = frame.method
+        confirmada = isinstance(metodo, pika.spec.Basic.Ack)
+        
+        if metodo.multiple:
+            tags = [tag for tag in self._pendentes if tag <= metodo.delivery_tag]
+        else:
+            tags = [metodo.delivery_tag]
+        
+        for tag in tags:
+            future = self._pendentes.pop(tag, None)
+            if future is None:
+                continue
+            self._liberar_janela()
+            if future.cancelled():
+                continue
+            if confirmada:
+                future.set_result(True)
+            else:
+                future.set_exception(RuntimeError(f"Mensagem {tag} rejeitada pelo RabbitMQ"))
+    
+    def _liberar_janela(self):
+        """Libera a vaga de uma mensagem que saiu de trânsito."""
+        self._janela.release()
+        with self._transito_cond:
+            self._em_transito -= 1
+            if self._em_transito == 0:
+                self._transito_cond.notify_all()
+    
+    def _falhar_pendentes(self, motivo):
+        """Resolve com erro todos os Futures ainda sem confirmação."""
+        pendentes, self._pendentes = self._pendentes, {}
+        for future in pendentes.values():
+            self._liberar_janela()
+            if not future.cancelled():
+                future.set_exception(ConnectionError(f"Conexão com o RabbitMQ perdida: {motivo}"))
 
 def consumir_mensagens(topico, callback, host='localhost', porta=5672, usuario='guest', senha='guest'):
     """
@@ -99,13 +522,15 @@ def consumir_mensagens(topico, callback, host='localhost', porta=5672, usuario='
         usuario (str): Nome de usuário para autenticação
         senha (str): Senha para autenticação
     """
+    connection = None
+    
     try:
         # Estabelece conexão
         connection = conectar_rabbitmq(host, porta, usuario, senha)
         channel = connection.channel()
         
         # Declara o exchange
-        channel.exchange_declare(exchange=topico, exchange_type='fanout', durable=True)
+        _ensure_exchange(channel, topico)
         
         # Declara uma fila exclusiva
         result = channel.queue_declare(queue='', exclusive=True)
@@ -117,27 +542,37 @@ def consumir_mensagens(topico, callback, host='localhost', porta=5672, usuario='
         # Define o callback para processar mensagens
         def process_message(ch, method, properties, body):
             try:
-                mensagem = json.loads(body.decode('utf-8'))
+                mensagem = _desserializar(body)
                 callback(mensagem)
                 ch.basic_ack(delivery_tag=method.delivery_tag)
             except Exception as e:
-                logger.error(f"Erro ao processar mensagem: {str(e)}")
+                logger.error("Erro ao processar mensagem: %s", e)
                 ch.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
         
         # Configura o consumo
         channel.basic_consume(queue=queue_name, on_message_callback=process_message)
         
-        logger.info(f"Iniciando consumo de mensagens do tópico '{topico}'")
+        logger.info("Iniciando consumo de mensagens do tópico '%s'", topico)
         channel.start_consuming()
     
     except Exception as e:
-        logger.error(f"Erro ao consumir mensagens do tópico '{topico}': {str(e)}")
+        logger.error("Erro ao consumir mensagens do tópico '%s': %s", topico, e)
         raise
+    
+    finally:
+        # A conexão é exclusiva deste consumo
+        if connection is not None:
+            _DECLARED.pop(id(connection), None)
 
 def consumir_mensagem_unica(topico, timeout=30, host='localhost', porta=5672, usuario='guest', senha='guest'):
     """
     Consome uma única mensagem de um tópico específico.
     
+    Usa um canal temporário sobre a conexão do pool e consulta a fila com
+    `basic_get` até receber uma mensagem ou esgotar o tempo de espera. Se a
+    conexão do pool falhar, a consulta é repetida uma vez com uma nova.
+    Mensagens que não são JSON válido são descartadas (nack), sem requeue.
+    
     Args:
         topico (str): Nome do tópico (exchange)
         timeout (int): Tempo máximo de espera em segundos
@@ -147,46 +582,77 @@ def consumir_mensagem_unica(topico, timeout=30, host='localhost', porta=5672, us
         senha (str): Senha para autenticação
         
     Returns:
-        dict: Mensagem consumida ou None se ocorrer timeout
+        dict: Mensagem consumida, ou None se ocorrer timeout ou a nova
+            tentativa também falhar
     """
-    try:
-        # Estabelece conexão
-        connection = conectar_rabbitmq(host, porta, usuario, senha)
-        channel = connection.channel()
-        
-        # Declara o exchange
-        channel.exchange_declare(exchange=topico, exchange_type='fanout', durable=True)
-        
-        # Declara uma fila exclusiva
-        result = channel.queue_declare(queue='', exclusive=True)
-        queue_name = result.method.queue
-        
-        # Vincula a fila ao exchange
-        channel.queue_bind(exchange=topico, queue=queue_name)
-        
-        # Variável para armazenar a mensagem
-        mensagem_recebida = None
-        
-        # Define o callback para processar mensagens
-        def process_message(ch, method, properties, body):
-            nonlocal mensagem_recebida
-            mensagem_recebida = json.loads(body.decode('utf-8'))
-            ch.basic_ack(delivery_tag=method.delivery_tag)
-            connection.close()
-        
-        # Configura o consumo
-        channel.basic_consume(queue=queue_name, on_message_callback=process_message)
-        
-        # Inicia o consumo com timeout
-        connection.add_timeout(timeout, lambda: connection.close())
+    chave = (host, porta, usuario)
+    deadline = time.monotonic() + timeout
+    
+    # A conexão do pool pode ter sido fechada pelo servidor enquanto ociosa;
+    # nesse caso, é descartada e a consulta é repetida uma vez com uma nova
+    for tentativa in range(2):
+        channel = None
+        queue_name = None
         
         try:
-            channel.start_consuming()
-        except pika.exceptions.ConnectionClosedByBroker:
-            pass
+            with _POOL_LOCK:
+                # Abre um canal próprio (não transacional) na conexão reutilizada
+                connection = _get_channel(host, porta, usuario, senha).connection
+                channel = connection.channel()
+                
+                # Declara o exchange (apenas na primeira vez nesta conexão)
+                _ensure_exchange(channel, topico)
+                
+                # Declara uma fila exclusiva
+                result = channel.queue_declare(queue='', exclusive=True)
+                queue_name = result.method.queue
+                
+                # Vincula a fila ao exchange
+                channel.queue_bind(exchange=topico, queue=queue_name)
+            
+            # Consulta a fila até receber uma mensagem ou atingir o prazo; o lock é
+            # liberado entre as consultas para não bloquear as publicações
+            while True:
+                with _POOL_LOCK:
+                    method, properties, body = channel.basic_get(queue=queue_name, auto_ack=False)
+                    if method is not None:
+                        # Confirma apenas depois de interpretar a mensagem
+                        try:
+                            mensagem = _desserializar(body)
+                        except Exception as e:
+                            # A fila é exclusiva: devolver a mensagem faria com que fosse lida de novo
+                            channel.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+                            logger.error("Mensagem inválida descartada do tópico '%s': %s", topico, e)
+                        else:
+                            channel.basic_ack(delivery_tag=method.delivery_tag)
+                            return mensagem
+                    
+                    # Atende heartbeats e demais eventos pendentes da conexão
+                    connection.process_data_events(time_limit=0)
+                
+                if time.monotonic() >= deadline:
+                    return None
+                time.sleep(_INTERVALO_POLLING)
         
-        return mensagem_recebida
+        except Exception as e:
+            with _POOL_LOCK:
+                _descartar_conexao(chave)
+            
+            if tentativa == 0:
+                logger.warning("Falha ao consumir mensagem do tópico '%s' (%s). Reconectando...", topico, e)
+            else:
+                logger.error("Erro ao consumir mensagem do tópico '%s': %s", topico, e)
+        
+        finally:
+            # A fila exclusiva só seria removida ao fechar a conexão, que é reutilizada
+            if channel is not None and channel.is_open:
+                with _POOL_LOCK:
+                    try:
+                        if queue_name is not None:
+                            channel.queue_delete(queue=queue_name)
+                        channel.close()
+                    except Exception as e:
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Erro ao fechar canal de consumo: %s", e)
     
-    except Exception as e:
-        logger.error(f"Erro ao consumir mensagem do tópico '{topico}': {str(e)}")
-        return None
+    return None